@@ -3,6 +3,7 @@ Configuration module for LewdCorner Launcher
 """
 from pathlib import Path
 import os
+import re
 
 # === Directory Paths ===
 ROOT_DIR = Path(__file__).parent.parent.parent
@@ -36,6 +37,19 @@ FORUM_PORTS_110 = f"{BASE_URL}/forums/ports.110/"  # Game Ports
 
 ALLOWED_FORUMS = [FORUM_GAMES_6, FORUM_GAMES_119, FORUM_PORTS_110]
 
+# Display slugs for progress messages, derived once at import. The
+# regex takes the last non-empty path segment and shrugs off trailing
+# slashes and malformed URLs
+_SLUG_RE = re.compile(r'/([^/]+)/?$')
+
+
+def _forum_slug(url: str) -> str:
+    match = _SLUG_RE.search(url)
+    return match.group(1) if match else 'Unknown'
+
+
+ALLOWED_FORUM_NAMES = tuple(_forum_slug(url) for url in ALLOWED_FORUMS)
+
 # === Scraper Settings ===
 DEFAULT_HEADLESS = True
 IMPLICIT_WAIT = 10
@@ -1,7 +1,7 @@
 """Authentication and session management"""
 
 from lewdcorner.core.auth.auth_service import AuthService
-from lewdcorner.core.auth.credential_manager import CredentialManager
+from lewdcorner.core.auth.credential_manager import CredentialManager, get_credential_manager
 from lewdcorner.core.auth.session_manager import SessionManager
 
-__all__ = ["AuthService", "CredentialManager", "SessionManager"]
+__all__ = ["AuthService", "CredentialManager", "get_credential_manager", "SessionManager"]
@@ -25,7 +25,7 @@ from lewdcorner.config import (
     PAGE_LOAD_TIMEOUT, MAX_RETRIES, RETRY_DELAY
 )
 from lewdcorner.core.auth.session_manager import SessionManager
-from lewdcorner.core.auth.credential_manager import CredentialManager
+from lewdcorner.core.auth.credential_manager import get_credential_manager
 
 logger = logging.getLogger(__name__)
 
@@ -37,7 +37,7 @@ class AuthService:
         self.headless = headless
         self.driver = None
         self.session_manager = SessionManager()
-        self.credential_manager = CredentialManager()
+        self.credential_manager = get_credential_manager()
         self.current_username = None
         self._initialized = False
     
@@ -102,11 +102,13 @@ class AuthService:
             logger.error(f"Failed to initialize WebDriver: {e}")
             raise RuntimeError(f"WebDriver initialization failed: {e}")
     
-    def login(self, username: str, password: str, remember: bool = True, 
-              save_credentials: bool = True) -> Dict[str, Any]:
+    def login(self, username: str, password: str, remember: bool = True) -> Dict[str, Any]:
         """
         Perform login with username and password
-        
+
+        `remember` drives both the site's remember-me checkbox and
+        whether credentials are saved to the keyring.
+
         Returns:
             Dict with status, message, and optional data
         """
@@ -182,7 +184,7 @@ class AuthService:
             )
             
             # Save credentials if requested
-            if save_credentials:
+            if remember:
                 self.credential_manager.save_credentials(username, password)
             
             logger.info(f"Login successful: {self.current_username}")
@@ -1,6 +1,7 @@
 """
 Secure credential storage using keyring and encrypted files
 """
+import functools
 import logging
 import keyring
 from typing import Optional
@@ -90,3 +91,9 @@ class CredentialManager:
         except Exception as e:
             logger.error(f"Failed to delete credentials: {e}")
             return False
+
+
+@functools.lru_cache(maxsize=1)
+def get_credential_manager() -> CredentialManager:
+    """Shared CredentialManager instance (keyring setup happens once)"""
+    return CredentialManager()
@@ -4,6 +4,8 @@ Complete database manager with all operations
 import sqlite3
 import logging
 import json
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
@@ -21,6 +23,11 @@ class DatabaseManager:
     def __init__(self, db_path: Path = DB_PATH):
         self.db_path = db_path
         self._connection = None
+        # Per-thread flag: only the thread that opened a transaction()
+        # block gets its commits deferred; writes from other threads
+        # (the connection is shared, check_same_thread=False) keep
+        # committing normally
+        self._transaction_state = threading.local()
         logger.info(f"DatabaseManager initialized with path: {db_path}")
     
     def connect(self) -> sqlite3.Connection:
@@ -74,6 +81,9 @@ class DatabaseManager:
     
     def commit(self):
         """Commit transaction"""
+        if getattr(self._transaction_state, 'active', False):
+            # Deferred until this thread's transaction() block exits
+            return
         if self._connection:
             self._connection.commit()
     
@@ -81,6 +91,25 @@ class DatabaseManager:
         """Rollback transaction"""
         if self._connection:
             self._connection.rollback()
+
+    @contextmanager
+    def transaction(self):
+        """Batch multiple writes into a single commit
+
+        Inside the block, per-operation commit() calls become no-ops and
+        everything lands in one commit on exit (rollback on error), so N
+        upserts cost one fsync instead of N.
+        """
+        conn = self.connect()
+        self._transaction_state.active = True
+        try:
+            yield conn
+            self._transaction_state.active = False
+            conn.commit()
+        except Exception:
+            self._transaction_state.active = False
+            conn.rollback()
+            raise
     
     def initialize_schema(self):
         """Initialize database schema"""
@@ -544,3 +573,37 @@ class DatabaseManager:
             (key, value)
         )
         self.commit()
+
+    def set_settings(self, settings: Dict[str, Any]):
+        """Set multiple settings in a single transaction"""
+        if not settings:
+            return
+
+        params = [
+            (key, value if isinstance(value, str) else json.dumps(value))
+            for key, value in settings.items()
+        ]
+        self.executemany(
+            "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+            params
+        )
+        self.commit()
+
+    def get_settings(self, keys: List[str]) -> Dict[str, Any]:
+        """Get multiple settings with one query"""
+        if not keys:
+            return {}
+
+        placeholders = ','.join('?' * len(keys))
+        rows = self.execute(
+            f"SELECT key, value FROM settings WHERE key IN ({placeholders})",
+            tuple(keys)
+        ).fetchall()
+
+        values = {}
+        for row in rows:
+            try:
+                values[row['key']] = json.loads(row['value'])
+            except:
+                values[row['key']] = row['value']
+        return values
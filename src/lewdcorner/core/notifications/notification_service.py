@@ -5,16 +5,21 @@ import logging
 from typing import List, Optional
 from datetime import datetime
 
+from PyQt6.QtCore import QObject, pyqtSignal
+
 from lewdcorner.core.db.database import DatabaseManager
 from lewdcorner.core.db.models import Notification
 
 logger = logging.getLogger(__name__)
 
 
-class NotificationService:
+class NotificationService(QObject):
     """Manages application notifications"""
-    
+
+    unread_count_changed = pyqtSignal(int)  # new unread count
+
     def __init__(self, db_manager: DatabaseManager):
+        super().__init__()
         self.db = db_manager
     
     def create_notification(self, 
@@ -35,6 +40,7 @@ class NotificationService:
         
         notification_id = self.db.add_notification(notification)
         logger.info(f"Created notification: {title}")
+        self.unread_count_changed.emit(self.get_unread_count())
         return notification_id
     
     def notify_game_update(self, game_id: int, game_title: str, old_version: str, new_version: str):
@@ -71,13 +77,15 @@ class NotificationService:
     def mark_as_read(self, notification_id: int):
         """Mark notification as read"""
         self.db.mark_notification_read(notification_id)
-    
+        self.unread_count_changed.emit(self.get_unread_count())
+
     def mark_all_as_read(self):
         """Mark all notifications as read"""
         notifications = self.get_unread_notifications(limit=1000)
         for notif in notifications:
             if notif.id:
-                self.mark_as_read(notif.id)
+                self.db.mark_notification_read(notif.id)
+        self.unread_count_changed.emit(self.get_unread_count())
     
     def get_unread_count(self) -> int:
         """Get count of unread notifications"""
@@ -4,7 +4,9 @@ Complete game scraper with all functionality
 import logging
 import time
 import hashlib
+import threading
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 from urllib.parse import urljoin
@@ -33,6 +35,9 @@ class GameScraper:
         self.auth_service = auth_service
         self.driver = None
         self.session = None
+        # The driver is a single browser; callers that fetch
+        # concurrently must serialize any fallback onto it
+        self._driver_lock = threading.Lock()
         self.forum_parser = ForumParser()
         self.metadata_extractor = MetadataExtractor()
         self.breadcrumb_parser = BreadcrumbParser()
@@ -50,11 +55,14 @@ class GameScraper:
         
         # Copy cookies from Selenium
         if self.driver:
-            for cookie in self.driver.get_cookies():
+            with self._driver_lock:
+                cookies = self.driver.get_cookies()
+                user_agent = self.driver.execute_script("return navigator.userAgent;")
+
+            for cookie in cookies:
                 self.session.cookies.set(cookie['name'], cookie['value'])
-            
+
             # Set headers
-            user_agent = self.driver.execute_script("return navigator.userAgent;")
             self.session.headers.update({
                 'User-Agent': user_agent,
                 'Referer': BASE_URL,
@@ -163,14 +171,22 @@ class GameScraper:
                 
                 logger.info(f"Found {len(games)} games on page {page_num}")
                 
-                # Download thumbnails
-                for game in games:
-                    if game.get('cover_image'):
-                        local_path = self.download_image(
-                            game['cover_image'],
-                            context=game.get('url', '')
-                        )
-                        game['cover_image'] = local_path
+                # Download thumbnails concurrently. Page loads are
+                # serialized on the one Selenium driver, but the image
+                # fetches are independent session requests
+                pending = [g for g in games if g.get('cover_image')]
+                if pending:
+                    with ThreadPoolExecutor(max_workers=min(8, len(pending))) as executor:
+                        futures = {
+                            executor.submit(
+                                self.download_image,
+                                game['cover_image'],
+                                game.get('url', '')
+                            ): game
+                            for game in pending
+                        }
+                        for future in as_completed(futures):
+                            futures[future]['cover_image'] = future.result()
                 
                 all_games.extend(games)
                 
@@ -213,41 +229,24 @@ class GameScraper:
         for attempt in range(retries):
             try:
                 logger.info(f"Scraping game details: {url} (attempt {attempt + 1})")
-                
-                self.driver.get(url)
-                
-                # Wait for content
-                WebDriverWait(self.driver, 20).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, ".message-body, .p-title"))
-                )
-                
-                time.sleep(2)
-                
-                # Parse page
-                html = self.driver.page_source
-                from bs4 import BeautifulSoup
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                # Extract all metadata
-                metadata = self.metadata_extractor.extract_all_metadata(soup, url)
-                
-                # Get category and forum from breadcrumbs
-                metadata['category'] = self.breadcrumb_parser.get_category(soup)
-                metadata['forum_id'] = self.breadcrumb_parser.get_forum_id(soup)
-                
-                # Download header image if available
-                if metadata.get('images'):
-                    header_url = metadata['images'][0]
-                    header_local = self.download_image(
-                        header_url,
-                        context=url,
-                        cache_dir=HEADERS_DIR
+
+                with self._driver_lock:
+                    self.driver.get(url)
+
+                    # Wait for content
+                    WebDriverWait(self.driver, 20).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, ".message-body, .p-title"))
                     )
-                    metadata['header_image'] = header_local
-                
-                logger.info(f"Successfully scraped: {metadata.get('title', 'Unknown')}")
-                return metadata
-                
+
+                    time.sleep(2)
+
+                    html = self.driver.page_source
+
+                details = self._parse_game_details(html, url)
+                if not details:
+                    logger.warning(f"No usable metadata at {url}, skipping")
+                return details
+
             except Exception as e:
                 logger.error(f"Failed to scrape {url} (attempt {attempt + 1}): {e}")
                 if attempt < retries - 1:
@@ -258,6 +257,72 @@ class GameScraper:
         
         return None
     
+    def _parse_game_details(self, html: str, url: str) -> Optional[Dict[str, Any]]:
+        """Extract full metadata from a thread page's HTML"""
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(html, 'html.parser')
+
+        # Extract all metadata
+        metadata = self.metadata_extractor.extract_all_metadata(soup, url)
+
+        # Extractor bails out early on non-thread URLs / missing titles
+        if not metadata.title:
+            return None
+
+        # Get category and forum from breadcrumbs
+        metadata.category = self.breadcrumb_parser.get_category(soup)
+        metadata.forum_id = self.breadcrumb_parser.get_forum_id(soup)
+
+        # Download header image if available
+        if metadata.images:
+            header_url = metadata.images[0]
+            metadata.header_image = self.download_image(
+                header_url,
+                context=url,
+                cache_dir=HEADERS_DIR
+            )
+
+        logger.info(f"Successfully scraped: {metadata.title}")
+        # Serialize at the DB/signal boundary
+        return metadata.to_dict()
+
+    def fetch_thread_html(self, url: str) -> Optional[str]:
+        """Fetch a thread page over the cookie-carrying requests session
+
+        Much cheaper than a driver navigation and safe to call from
+        several threads at once. Returns None when the fetch fails, so
+        callers can fall back to the browser.
+        """
+        if not self.session:
+            self._init_requests_session()
+
+        try:
+            response = self.session.get(url, timeout=30)
+            response.raise_for_status()
+            return response.text
+        except Exception as e:
+            logger.debug(f"Session fetch failed for {url}: {e}")
+            return None
+
+    def scrape_game_details_fast(self, url: str) -> Optional[Dict[str, Any]]:
+        """Scrape game details, preferring the session over the driver
+
+        Thread pages are server-rendered, so a plain HTTP fetch usually
+        suffices and can run concurrently. Pages the session cannot get
+        usable metadata from (login walls, challenges) fall back to the
+        serialized Selenium path.
+        """
+        html = self.fetch_thread_html(url)
+        if html:
+            try:
+                details = self._parse_game_details(html, url)
+                if details:
+                    return details
+            except Exception as e:
+                logger.debug(f"Failed to parse session-fetched page {url}: {e}")
+
+        return self.scrape_game_details(url)
+
     def scrape_bookmarks(self, max_pages: int = 50) -> List[Dict[str, Any]]:
         """
         Scrape user's bookmarked games
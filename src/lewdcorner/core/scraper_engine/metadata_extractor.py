@@ -3,6 +3,7 @@ Metadata extraction from game threads - FIXED AND IMPROVED
 """
 import re
 import logging
+from dataclasses import dataclass, field, asdict
 from typing import Dict, List, Any, Optional
 from bs4 import BeautifulSoup, Tag
 
@@ -10,6 +11,76 @@ from lewdcorner.config import ENGINE_LABELS, STATUS_LABELS
 
 logger = logging.getLogger(__name__)
 
+# Version patterns, compiled once at import. Possessive quantifiers
+# (Python 3.11+) prevent backtracking between the overlapping digit/dot
+# classes, keeping matching linear even on pathological titles.
+_VERSION_PATTERNS = [
+    re.compile(p, re.IGNORECASE) for p in (
+        # The dotted-number core is written as (?:\.\d++)*+ rather than
+        # a [\d.] class so the possessive repeat can never swallow
+        # sentence punctuation right after the version ("v1.0. Final")
+        # and then fail the following \b or \] with backtracking off
+        r'\[v\.?+(\d++(?:\.\d++)*+[a-zA-Z0-9]*+)\]',    # [v1.0], [v.1.0]
+        r'\[(\d++(?:\.\d++)++[a-zA-Z0-9]*+)\]',         # [1.0.1]
+        r'\bv\.?+(\d++(?:\.\d++)++[a-zA-Z0-9]*+)\b',    # v1.0, v.1.0
+        r'version\s++(\d++(?:\.\d++)++[a-zA-Z0-9]*+)',  # version 1.0
+        r'\[(Final|Completed|Complete)\]',         # [Final]
+    )
+]
+
+# Keyword sets compiled to single alternations so each heading/link is
+# scanned once instead of once per keyword
+_DL_KEYWORDS_RE = re.compile(r'download|mirror|links|get the game', re.IGNORECASE)
+_DEV_KEYWORDS_RE = re.compile(r'developer|dev|creator|author', re.IGNORECASE)
+_DEV_FIELD_RE = re.compile(r'(?:developer|dev|creator|author):', re.IGNORECASE)
+_KNOWN_HOSTS_RE = re.compile(
+    r'mega\.nz|gofile\.io|pixeldrain\.com|workupload\.com|anonfiles\.com|'
+    r'mediafire\.com|drive\.google\.com|uploadhaven\.com|mixdrop\.co|krakenfiles\.com',
+    re.IGNORECASE
+)
+
+@dataclass(slots=True)
+class DownloadLink:
+    """A single download link found in a game thread"""
+    host: str
+    url: str
+    label: str
+
+    def to_dict(self) -> Dict[str, str]:
+        """Convert to dictionary"""
+        return asdict(self)
+
+
+@dataclass(slots=True)
+class GameMetadata:
+    """
+    Scraped metadata for one game thread
+
+    Slotted so thousands of scraped records stay compact; convert with
+    to_dict() only at the database/signal boundary.
+    """
+    title: str = ""
+    url: str = ""
+    thread_id: Optional[str] = None
+    version: str = "Unknown"
+    engine: str = "Unknown"
+    status: str = "Unknown"
+    developer: str = "Unknown"
+    description: str = ""
+    changelog: str = ""
+    tags: List[str] = field(default_factory=list)
+    images: List[str] = field(default_factory=list)
+    download_links: List[DownloadLink] = field(default_factory=list)
+
+    # Filled in by the scraper after extraction
+    category: str = ""
+    forum_id: str = ""
+    header_image: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary (download links become dicts too)"""
+        return asdict(self)
+
 
 class MetadataExtractor:
     """Extracts metadata from game pages"""
@@ -59,19 +130,11 @@ class MetadataExtractor:
     def extract_version(title: str) -> str:
         """Extract version from title string"""
         # Common patterns: [v1.0], [1.0], [Version 1.0], [Final], [v0.1.2]
-        patterns = [
-            r'\[v\.?(\d+[\d.]*[a-zA-Z0-9]*)\]',  # [v1.0], [v.1.0]
-            r'\[(\d+\.[\d.]+[a-zA-Z0-9]*)\]',     # [1.0.1]
-            r'\bv\.?(\d+\.[\d.]+[a-zA-Z0-9]*)\b',  # v1.0, v.1.0
-            r'version\s+(\d+\.[\d.]+[a-zA-Z0-9]*)',  # version 1.0
-            r'\[(Final|Completed|Complete)\]',     # [Final]
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, title, re.IGNORECASE)
+        for pattern in _VERSION_PATTERNS:
+            match = pattern.search(title)
             if match:
                 return match.group(1)
-        
+
         return "Unknown"
     
     @staticmethod
@@ -88,22 +151,21 @@ class MetadataExtractor:
         developer = "Unknown"
         
         # METHOD 1: Look for "Developer:" in description
+        # Description comes from extract_description via get_text(), so it's
+        # already plain text - no HTML stripping needed here
         if description:
             dev_patterns = [
-                r'Developer:\s*(.+?)(?:\n|<br|$)',
-                r'Dev:\s*(.+?)(?:\n|<br|$)',
-                r'Made\s+by:\s*(.+?)(?:\n|<br|$)',
-                r'Creator:\s*(.+?)(?:\n|<br|$)',
-                r'Author:\s*(.+?)(?:\n|<br|$)',
+                r'Developer:\s*(.+?)(?:\n|$)',
+                r'Dev:\s*(.+?)(?:\n|$)',
+                r'Made\s+by:\s*(.+?)(?:\n|$)',
+                r'Creator:\s*(.+?)(?:\n|$)',
+                r'Author:\s*(.+?)(?:\n|$)',
             ]
-            
+
             for pattern in dev_patterns:
                 match = re.search(pattern, description, re.IGNORECASE)
                 if match:
-                    potential_dev = match.group(1).strip()
-                    # Clean up HTML tags if any
-                    potential_dev = re.sub(r'<[^>]+>', '', potential_dev)
-                    potential_dev = potential_dev.split('\n')[0].strip()
+                    potential_dev = match.group(1).split('\n')[0].strip()
                     # Remove common suffixes
                     potential_dev = re.sub(r'\s+\[.*?\]$', '', potential_dev)
                     if potential_dev and len(potential_dev) > 2:
@@ -118,16 +180,16 @@ class MetadataExtractor:
                     dt = dl.find('dt')
                     dd = dl.find('dd')
                     if dt and dd:
-                        dt_text = dt.get_text(strip=True).lower()
-                        if any(keyword in dt_text for keyword in ['developer', 'dev', 'creator', 'author']):
+                        dt_text = dt.get_text(strip=True)
+                        if _DEV_KEYWORDS_RE.search(dt_text):
                             dev_text = dd.get_text(strip=True)
                             if dev_text and len(dev_text) > 2 and len(dev_text) < 100:
                                 return dev_text
                 
                 # Check for bold/strong labels
                 for strong in soup.find_all(['strong', 'b']):
-                    text = strong.get_text(strip=True).lower()
-                    if any(keyword in text for keyword in ['developer:', 'dev:', 'creator:', 'author:']):
+                    text = strong.get_text(strip=True)
+                    if _DEV_FIELD_RE.search(text):
                         # Get next sibling text
                         next_text = strong.next_sibling
                         if next_text and isinstance(next_text, str):
@@ -170,11 +232,22 @@ class MetadataExtractor:
         return developer
     
     @staticmethod
-    def extract_description(soup: BeautifulSoup) -> str:
+    def find_first_post(soup: BeautifulSoup) -> Tag:
+        """
+        Locate the first post of the thread
+
+        Computed once per page and passed to the extractors below so
+        each doesn't repeat the same whole-page tree walk.
+        """
+        return soup.select_one('.message--post.js-post') or soup
+
+    @staticmethod
+    def extract_description(soup: BeautifulSoup, first_post: Optional[Tag] = None) -> str:
         """Extract game description from first post"""
         try:
             # Find first message body
-            message_body = soup.select_one('.message-body .bbWrapper')
+            root = first_post if first_post is not None else soup
+            message_body = root.select_one('.message-body .bbWrapper')
             if message_body:
                 # Get text, preserving newlines
                 description = message_body.get_text('\n', strip=True)
@@ -188,11 +261,12 @@ class MetadataExtractor:
         return ""
     
     @staticmethod
-    def extract_changelog(soup: BeautifulSoup) -> str:
+    def extract_changelog(soup: BeautifulSoup, first_post: Optional[Tag] = None) -> str:
         """Extract changelog from thread"""
         try:
+            root = first_post if first_post is not None else soup
             # Look for sections with "changelog" in heading
-            for heading in soup.select('h1, h2, h3, h4, b, strong'):
+            for heading in root.select('h1, h2, h3, h4, b, strong'):
                 text = heading.get_text(strip=True).lower()
                 if 'changelog' in text or 'change log' in text:
                     # Get following content
@@ -211,50 +285,59 @@ class MetadataExtractor:
         
         return ""
     
+    MAX_TAGS = 20
+
     @staticmethod
     def extract_tags(soup: BeautifulSoup, description: str = "") -> List[str]:
         """Extract tags/genres"""
-        tags = []
-        
+        # Ordered dedup with an early cap - no full-list + set round-trip
+        tags: Dict[str, None] = {}
+
         try:
             # Look in thread tags
             tag_elements = soup.select('.tagItem, [class*="tag"]')
             for tag_elem in tag_elements:
+                if len(tags) >= MetadataExtractor.MAX_TAGS:
+                    break
                 tag_text = tag_elem.get_text(strip=True)
-                if tag_text and len(tag_text) < 30:
-                    tags.append(tag_text)
-            
+                if 0 < len(tag_text) < 30:
+                    tags.setdefault(tag_text, None)
+
             # Look in description
             tag_patterns = [
                 r'Tags?:\s*(.+?)(?:\n|$)',
                 r'Genres?:\s*(.+?)(?:\n|$)',
             ]
-            
+
             for pattern in tag_patterns:
+                if len(tags) >= MetadataExtractor.MAX_TAGS:
+                    break
                 match = re.search(pattern, description, re.IGNORECASE)
                 if match:
-                    tag_text = match.group(1)
                     # Split by common separators
-                    found_tags = re.split(r'[,/;]', tag_text)
-                    tags.extend([t.strip() for t in found_tags if t.strip()])
-        
+                    for tag_text in re.split(r'[,/;]', match.group(1)):
+                        if len(tags) >= MetadataExtractor.MAX_TAGS:
+                            break
+                        tag_text = tag_text.strip()
+                        if tag_text:
+                            tags.setdefault(tag_text, None)
+
         except Exception as e:
             logger.error(f"Failed to extract tags: {e}")
-        
-        # Deduplicate and limit
-        tags = list(set(tags))[:20]
-        return tags
+
+        return list(tags)
     
     @staticmethod
-    def extract_images(soup: BeautifulSoup) -> List[str]:
+    def extract_images(soup: BeautifulSoup, first_post: Optional[Tag] = None) -> List[str]:
         """Extract image URLs from post"""
         images = []
-        
+
         try:
             # Find images in message body
             # Look for images in first post
-            first_post = soup.select_one('.message--post.js-post')
-            if first_post:
+            if first_post is None:
+                first_post = soup.select_one('.message--post.js-post')
+            if first_post is not None and first_post is not soup:
                 img_elements = first_post.select('img.bbImage, img[src]')
             else:
                 img_elements = soup.select('.message-body img.bbImage, .message-body img[src]')
@@ -285,22 +368,17 @@ class MetadataExtractor:
         return unique_images[:10]  # Limit to 10 images
     
     @staticmethod
-    def extract_download_links(soup: BeautifulSoup, description: str = "") -> List[Dict[str, str]]:
-        """
-        Extract download links from post
-        
-        Returns list of dicts with 'host', 'url', 'label'
-        """
+    def extract_download_links(soup: BeautifulSoup, description: str = "",
+                               first_post: Optional[Tag] = None) -> List[DownloadLink]:
+        """Extract download links from post"""
         downloads = []
-        
+        root = first_post if first_post is not None else soup
+
         try:
-            # Look for download sections
-            download_keywords = ['download', 'mirror', 'links', 'get the game']
-            
-            # METHOD 1: Find headings with "download"
-            for heading in soup.find_all(['h1', 'h2', 'h3', 'h4', 'b', 'strong']):
-                heading_text = heading.get_text(strip=True).lower()
-                if any(keyword in heading_text for keyword in download_keywords):
+            # METHOD 1: Find headings with "download"/"mirror"/"links"
+            for heading in root.find_all(['h1', 'h2', 'h3', 'h4', 'b', 'strong']):
+                heading_text = heading.get_text(strip=True)
+                if _DL_KEYWORDS_RE.search(heading_text):
                     # Get links after this heading
                     for sibling in heading.next_siblings:
                         if isinstance(sibling, Tag):
@@ -314,35 +392,32 @@ class MetadataExtractor:
                                 url = link['href']
                                 text = link.get_text(strip=True)
                                 host = MetadataExtractor._identify_host(url)
-                                
+
                                 if host:
-                                    downloads.append({
-                                        'host': host,
-                                        'url': url,
-                                        'label': text or host
-                                    })
-            
-            # METHOD 2: Find all links and filter by known hosts
-            all_links = soup.find_all('a', href=True)
-            known_hosts = ['mega.nz', 'gofile.io', 'pixeldrain.com', 'workupload.com', 
-                          'anonfiles.com', 'mediafire.com', 'drive.google.com',
-                          'uploadhaven.com', 'mixdrop.co', 'krakenfiles.com']
+                                    downloads.append(DownloadLink(
+                                        host=host,
+                                        url=url,
+                                        label=text or host
+                                    ))
             
+            # METHOD 2: Find links in the first post and filter by known
+            # hosts. Scanning the whole page would also visit every quote,
+            # signature and reply in the thread.
+            all_links = root.find_all('a', href=True)
+
             for link in all_links:
                 url = link['href']
-                text = link.get_text(strip=True)
-                
+
                 # Check if URL contains known host
-                for host_pattern in known_hosts:
-                    if host_pattern in url.lower():
-                        host = MetadataExtractor._identify_host(url)
-                        if host:
-                            downloads.append({
-                                'host': host,
-                                'url': url,
-                                'label': text or host
-                            })
-                        break
+                if _KNOWN_HOSTS_RE.search(url):
+                    host = MetadataExtractor._identify_host(url)
+                    if host:
+                        text = link.get_text(strip=True)
+                        downloads.append(DownloadLink(
+                            host=host,
+                            url=url,
+                            label=text or host
+                        ))
             
         except Exception as e:
             logger.error(f"Failed to extract download links: {e}")
@@ -351,10 +426,10 @@ class MetadataExtractor:
         seen_urls = set()
         unique_downloads = []
         for dl in downloads:
-            if dl['url'] not in seen_urls:
-                seen_urls.add(dl['url'])
+            if dl.url not in seen_urls:
+                seen_urls.add(dl.url)
                 unique_downloads.append(dl)
-        
+
         return unique_downloads
     
     @staticmethod
@@ -392,32 +467,47 @@ class MetadataExtractor:
         return None
     
     @staticmethod
-    def extract_all_metadata(soup: BeautifulSoup, url: str) -> Dict[str, Any]:
+    def extract_all_metadata(soup: BeautifulSoup, url: str) -> GameMetadata:
         """Extract all metadata from a game page"""
+        # Cheap precondition checks first - skip the whole extraction
+        # pipeline for pages we can't use anyway
+        thread_id = MetadataExtractor.extract_thread_id(url)
+        if not thread_id:
+            logger.debug(f"Not a valid thread URL, skipping extraction: {url}")
+            return GameMetadata(url=url)
+
         # Get title
         title_elem = soup.select_one('h1.p-title-value')
-        title = title_elem.get_text(strip=True) if title_elem else ""
-        
-        # Get description
-        description = MetadataExtractor.extract_description(soup)
-        
+        if title_elem is None:
+            logger.debug(f"No thread title found, skipping extraction: {url}")
+            return GameMetadata(url=url, thread_id=thread_id)
+        title = title_elem.get_text(strip=True)
+
+        # Resolve the first post once; the post-scoped extractors below
+        # all reuse it instead of repeating the same whole-page walk
+        first_post = MetadataExtractor.find_first_post(soup)
+
+        # Description resolves first: developer/tags/downloads take it
+        # as input. The extractors are pure-Python soup walks (the repo
+        # parses with html.parser), so threading them buys nothing under
+        # the GIL - pages already run concurrently in the detail scrape
+        description = MetadataExtractor.extract_description(soup, first_post)
+
         # Extract developer (improved method)
         developer = MetadataExtractor.extract_developer(title, description, soup)
-        
+
         # Extract various fields
-        metadata = {
-            'title': title,
-            'url': url,
-            'thread_id': MetadataExtractor.extract_thread_id(url),
-            'version': MetadataExtractor.extract_version(title),
-            'engine': MetadataExtractor.extract_engine_from_labels(soup),
-            'status': MetadataExtractor.extract_status_from_labels(soup),
-            'developer': developer,
-            'description': description,
-            'changelog': MetadataExtractor.extract_changelog(soup),
-            'tags': MetadataExtractor.extract_tags(soup, description),
-            'images': MetadataExtractor.extract_images(soup),
-            'download_links': MetadataExtractor.extract_download_links(soup, description),
-        }
-        
-        return metadata
+        return GameMetadata(
+            title=title,
+            url=url,
+            thread_id=thread_id,
+            version=MetadataExtractor.extract_version(title),
+            engine=MetadataExtractor.extract_engine_from_labels(soup),
+            status=MetadataExtractor.extract_status_from_labels(soup),
+            developer=developer,
+            description=description,
+            changelog=MetadataExtractor.extract_changelog(soup, first_post),
+            tags=MetadataExtractor.extract_tags(soup, description),
+            images=MetadataExtractor.extract_images(soup, first_post),
+            download_links=MetadataExtractor.extract_download_links(soup, description, first_post),
+        )
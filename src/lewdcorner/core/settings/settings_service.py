@@ -52,6 +52,41 @@ class SettingsService:
         self.db.set_setting(key, value)
         self._cache[key] = value
         logger.debug(f"Setting updated: {key} = {value}")
+
+    def update(self, settings: Dict[str, Any]):
+        """Set multiple settings with a single write/commit"""
+        self.db.set_settings(settings)
+        self._cache.update(settings)
+        logger.debug(f"Settings updated: {list(settings.keys())}")
+
+    def get_many(self, defaults: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Get multiple settings at once
+
+        Takes a {key: default} mapping and resolves uncached keys with
+        one query instead of a DB round-trip per key.
+        """
+        values = {}
+        missing = []
+        for key in defaults:
+            if key in self._cache:
+                values[key] = self._cache[key]
+            else:
+                missing.append(key)
+
+        if missing:
+            stored = self.db.get_settings(missing)
+            for key in missing:
+                # Same resolution order as get(): stored value, then the
+                # caller's default, then DEFAULT_SETTINGS only when the
+                # caller passed None
+                value = stored.get(key, defaults[key])
+                if value is None and key in self.DEFAULT_SETTINGS:
+                    value = self.DEFAULT_SETTINGS[key]
+                self._cache[key] = value
+                values[key] = value
+
+        return values
     
     def get_all(self) -> Dict[str, Any]:
         """Get all settings"""
@@ -1,17 +1,20 @@
 """
 Main application entry point
 """
+import asyncio
 import sys
 import logging
 from pathlib import Path
 from PyQt6.QtWidgets import QApplication, QMessageBox
 from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QPixmapCache
+import qasync
 
-from lewdcorner.config import LOGS_DIR, LOG_LEVEL
+from lewdcorner.config import LOGS_DIR, LOG_LEVEL, IMAGE_CACHE_SIZE_MB
 from lewdcorner.core.auth.auth_service import AuthService
 from lewdcorner.core.db.database import DatabaseManager
 from lewdcorner.ui.main_window.main_window import MainWindow
-from lewdcorner.ui.dialogs.login_dialog import LoginDialog
+from lewdcorner.ui.dialogs.login_dialog import LoginDialog, shutdown_auth_executor
 
 
 def setup_logging():
@@ -47,8 +50,17 @@ def main():
         app = QApplication(sys.argv)
         app.setApplicationName("LewdCornerLauncher")
         app.setOrganizationName("LewdCorner")
-        
+
         # Note: AA_UseHighDpiPixmaps removed in PyQt6 (now default behavior)
+
+        # Bound cover-thumbnail memory; the limit is in kilobytes
+        QPixmapCache.setCacheLimit(IMAGE_CACHE_SIZE_MB * 1024)
+
+        # Install the asyncio event loop on top of Qt's so async slots
+        # (e.g. login) can run without spawning worker threads per call
+        loop = qasync.QEventLoop(app)
+        asyncio.set_event_loop(loop)
+        app.aboutToQuit.connect(shutdown_auth_executor)
         
         logger.info("Initializing database...")
         
@@ -81,9 +93,13 @@ def main():
         
         logger.info("Main window shown")
         
-        # Run application
-        result = app.exec()
-        
+        # Run application (qasync loop drives Qt and asyncio together)
+        app_close_event = asyncio.Event()
+        app.aboutToQuit.connect(app_close_event.set)
+        with loop:
+            loop.run_until_complete(app_close_event.wait())
+        result = 0
+
         # Cleanup
         logger.info("Application closing...")
         auth_service.quit()
@@ -1,52 +1,33 @@
 """
 Login dialog for authentication
 """
+import asyncio
+import functools
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel,
     QLineEdit, QPushButton, QCheckBox, QMessageBox,
     QProgressBar
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from qasync import asyncSlot
 
 from lewdcorner.core.auth.auth_service import AuthService
-from lewdcorner.core.auth.credential_manager import CredentialManager
+from lewdcorner.core.auth.credential_manager import get_credential_manager
 
 logger = logging.getLogger(__name__)
 
+# Bounded pool for blocking auth calls, reused across dialog opens.
+# Auth is serialized through one Selenium driver, so one worker is
+# enough; a bounded pool also caps thread count at shutdown.
+_AUTH_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="auth")
 
-class LoginWorker(QThread):
-    """Worker thread for login operations"""
-    
-    finished = pyqtSignal(bool, str, dict)  # success, message, data
-    
-    def __init__(self, auth_service: AuthService, operation: str, **kwargs):
-        super().__init__()
-        self.auth_service = auth_service
-        self.operation = operation
-        self.kwargs = kwargs
-    
-    def run(self):
-        try:
-            if self.operation == 'login':
-                result = self.auth_service.login(
-                    self.kwargs['username'],
-                    self.kwargs['password'],
-                    remember=self.kwargs.get('remember', True),
-                    save_credentials=self.kwargs.get('save_credentials', True)
-                )
-            elif self.operation == 'load_session':
-                result = self.auth_service.load_session(self.kwargs['master_password'])
-            else:
-                result = {'status': 'error', 'message': 'Unknown operation'}
-            
-            success = result.get('status') == 'success'
-            message = result.get('message', '')
-            self.finished.emit(success, message, result)
-            
-        except Exception as e:
-            logger.error(f"Login worker error: {e}")
-            self.finished.emit(False, str(e), {})
+
+def shutdown_auth_executor():
+    """Stop the auth worker pool; call on application quit"""
+    _AUTH_EXECUTOR.shutdown(wait=False, cancel_futures=True)
 
 
 class LoginDialog(QDialog):
@@ -58,15 +39,18 @@ class LoginDialog(QDialog):
         super().__init__(parent)
         
         self.auth_service = auth_service
-        self.credential_manager = CredentialManager()
-        self.login_worker = None
+        self.credential_manager = get_credential_manager()
+        self._master_pw_cache = (None, 0.0)
+        self._auth_in_flight = False
+        self._loading_state = False
         
         self.setWindowTitle("Login to LewdCorner")
         self.setModal(True)
         self.resize(400, 300)
         
         self._setup_ui()
-        self._load_saved_credentials()
+        # Defer the keyring read so it can't block the first paint
+        QTimer.singleShot(0, self._load_saved_credentials)
     
     def _setup_ui(self):
         """Setup UI"""
@@ -126,41 +110,93 @@ class LoginDialog(QDialog):
         
         layout.addLayout(button_layout)
     
-    def _load_saved_credentials(self):
-        """Load saved credentials if available"""
-        credentials = self.credential_manager.get_credentials()
+    # Keyring lookups go through DBus/Win32 and cost tens of ms; cache
+    # the master password for the dialog's lifetime (5 min TTL)
+    _MASTER_PW_TTL = 300.0
+
+    def _master_pw(self):
+        """Get the master password, cached across handler calls"""
+        value, fetched_at = self._master_pw_cache
+        if value is not None and time.monotonic() - fetched_at < self._MASTER_PW_TTL:
+            return value
+
+        value = self.credential_manager.get_master_password()
+        self._master_pw_cache = (value, time.monotonic())
+        return value
+
+    def reject(self):
+        """Close the dialog, dropping any cached secrets"""
+        self._master_pw_cache = (None, 0.0)
+        super().reject()
+
+    @asyncSlot()
+    async def _load_saved_credentials(self):
+        """Load saved credentials if available (keyring read off-thread)"""
+        credentials = await asyncio.get_event_loop().run_in_executor(
+            _AUTH_EXECUTOR, self.credential_manager.get_credentials
+        )
         if credentials:
+            # Back on the Qt thread here
             username, password = credentials
             self.username_input.setText(username)
             self.password_input.setText(password)
     
-    def on_login(self):
+    async def _run_auth(self, func, *args, **kwargs):
+        """
+        Single dispatch point for blocking auth calls
+
+        Owns the loading state and runs the call on the long-lived auth
+        executor; the coroutine resumes on the Qt thread, so the result
+        is handed straight to on_login_finished without marshalling.
+        """
+        self._auth_in_flight = True
+        self._set_loading(True)
+        try:
+            result = await asyncio.get_event_loop().run_in_executor(
+                _AUTH_EXECUTOR, functools.partial(func, *args, **kwargs)
+            )
+        except Exception as e:
+            logger.error("Login worker error: %s", e)
+            self.on_login_finished(False, str(e), {})
+            return
+        finally:
+            self._auth_in_flight = False
+
+        success = result.get('status') == 'success'
+        message = result.get('message', '')
+        self.on_login_finished(success, message, result)
+
+    @asyncSlot()
+    async def on_login(self):
         """Handle login button click"""
+        # Return/default-button activation can re-enter before the
+        # loading state disables the button - drop duplicate submits
+        if self._auth_in_flight:
+            return
+
         username = self.username_input.text().strip()
         password = self.password_input.text()
-        
+
         if not username or not password:
             QMessageBox.warning(self, "Error", "Please enter username and password")
             return
-        
-        self._set_loading(True)
-        
-        # Start login in background thread
-        self.login_worker = LoginWorker(
-            self.auth_service,
-            'login',
-            username=username,
-            password=password,
-            remember=True,
-            save_credentials=self.remember_check.isChecked()
+
+        # Run login in the background executor
+        await self._run_auth(
+            self.auth_service.login,
+            username,
+            password,
+            remember=self.remember_check.isChecked()
         )
-        self.login_worker.finished.connect(self.on_login_finished)
-        self.login_worker.start()
-    
-    def on_load_session(self):
+
+    @asyncSlot()
+    async def on_load_session(self):
         """Handle load session button click"""
-        master_password = self.credential_manager.get_master_password()
-        
+        if self._auth_in_flight:
+            return
+
+        master_password = self._master_pw()
+
         if not master_password:
             # Prompt for master password
             from PyQt6.QtWidgets import QInputDialog
@@ -170,22 +206,14 @@ class LoginDialog(QDialog):
                 "Enter master password:",
                 QLineEdit.EchoMode.Password
             )
-            
+
             if not ok or not password:
                 return
-            
+
             master_password = password
-        
-        self._set_loading(True)
-        
-        # Start session load in background
-        self.login_worker = LoginWorker(
-            self.auth_service,
-            'load_session',
-            master_password=master_password
-        )
-        self.login_worker.finished.connect(self.on_login_finished)
-        self.login_worker.start()
+
+        # Run session load in the background executor
+        await self._run_auth(self.auth_service.load_session, master_password)
     
     def on_login_finished(self, success: bool, message: str, data: dict):
         """Handle login completion"""
@@ -193,13 +221,18 @@ class LoginDialog(QDialog):
         
         if success:
             # Save session
-            master_password = self.credential_manager.get_master_password()
+            master_password = self._master_pw()
             if not master_password:
                 master_password = self.password_input.text()
                 self.credential_manager.save_master_password(master_password)
-            
+
             self.auth_service.save_session(master_password)
-            
+            del master_password
+
+            # Don't keep the plaintext password sitting in the widget
+            # (and pinned in the heap) once the session is saved
+            self.password_input.clear()
+
             self.login_successful.emit(data)
             self.accept()
         else:
@@ -207,6 +240,11 @@ class LoginDialog(QDialog):
     
     def _set_loading(self, loading: bool):
         """Set loading state"""
+        # Each setEnabled below invalidates widget style; skip no-op calls
+        if loading == self._loading_state:
+            return
+        self._loading_state = loading
+
         self.progress_bar.setVisible(loading)
         self.login_button.setEnabled(not loading)
         self.session_button.setEnabled(not loading)
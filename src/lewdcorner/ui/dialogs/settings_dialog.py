@@ -1,17 +1,43 @@
 """
 Settings dialog with tabs
 """
+import asyncio
 import logging
 from PyQt6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QTabWidget,
     QWidget, QLabel, QComboBox, QCheckBox, QPushButton,
     QSpinBox, QGroupBox, QFormLayout, QMessageBox, QSlider
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from qasync import asyncSlot
 from lewdcorner.core.settings.settings_service import SettingsService
 
 logger = logging.getLogger(__name__)
 
+# Defaults for every setting the dialog edits, grouped per tab so the
+# loaders can batch-fetch their keys in one call
+SETTINGS_DEFAULTS = {
+    'launch_on_startup': False,
+    'minimize_to_tray': True,
+    'close_to_tray': False,
+    'auto_check_updates': True,
+    'theme': 'dark',
+    'font_size': 13,
+    'grid_columns': 4,
+    'concurrent_downloads': 3,
+    'cache_size_mb': 1000,
+    'auto_extract': True,
+    'debug_mode': False,
+    'scraper_delay': 2,
+    'max_retries': 3,
+}
+
+_GENERAL_KEYS = ('launch_on_startup', 'minimize_to_tray', 'close_to_tray',
+                 'auto_check_updates')
+_APPEARANCE_KEYS = ('theme', 'font_size', 'grid_columns')
+_DOWNLOADS_KEYS = ('concurrent_downloads', 'cache_size_mb', 'auto_extract')
+_ADVANCED_KEYS = ('debug_mode', 'scraper_delay', 'max_retries')
+
 
 class SettingsDialog(QDialog):
     """Settings dialog with multiple tabs"""
@@ -27,25 +53,40 @@ class SettingsDialog(QDialog):
         self.setWindowTitle("Settings")
         self.setModal(True)
         self.resize(700, 600)
-        
+
         self._setup_ui()
-        self._load_settings()
-    
+
     def _setup_ui(self):
         """Setup UI"""
         layout = QVBoxLayout(self)
-        
-        # Tabs
+
+        # Tabs - built lazily so opening the dialog only pays for the
+        # tab actually shown, not all ~40 widgets upfront
         self.tabs = QTabWidget()
         layout.addWidget(self.tabs)
-        
-        # Add tabs
-        self.tabs.addTab(self._create_general_tab(), "⚙️ General")
-        self.tabs.addTab(self._create_appearance_tab(), "🎨 Appearance")
-        self.tabs.addTab(self._create_downloads_tab(), "📥 Downloads")
-        self.tabs.addTab(self._create_advanced_tab(), "🔧 Advanced")
-        self.tabs.addTab(self._create_account_tab(), "👤 Account")
-        
+
+        self._tab_builders = [
+            ("⚙️ General", self._create_general_tab, self._load_general_settings),
+            ("🎨 Appearance", self._create_appearance_tab, self._load_appearance_settings),
+            ("📥 Downloads", self._create_downloads_tab, self._load_downloads_settings),
+            ("🔧 Advanced", self._create_advanced_tab, self._load_advanced_settings),
+            ("👤 Account", self._create_account_tab, None),
+        ]
+        self._built_tabs = set()
+
+        for label, _builder, _loader in self._tab_builders:
+            self.tabs.addTab(QWidget(), label)
+
+        self.tabs.currentChanged.connect(self._ensure_tab)
+        self._ensure_tab(0)
+
+        # Non-modal status toast; modal info boxes spin a nested event
+        # loop that stalls timers and coroutines
+        self.status_label = QLabel()
+        self.status_label.setObjectName("subheadingLabel")
+        self.status_label.setVisible(False)
+        layout.addWidget(self.status_label)
+
         # Buttons
         button_layout = QHBoxLayout()
         button_layout.addStretch()
@@ -60,7 +101,79 @@ class SettingsDialog(QDialog):
         button_layout.addWidget(cancel_btn)
         
         layout.addLayout(button_layout)
-    
+
+    def _toast(self, message: str):
+        """Show a transient status message without a modal popup"""
+        self.status_label.setText(message)
+        self.status_label.setVisible(True)
+        QTimer.singleShot(2500, lambda: self.status_label.setVisible(False))
+
+    def showEvent(self, event):
+        """Reset reused-instance state before each open
+
+        The dialog instance is reused across opens, so a pending toast
+        timer from the last session must not greet the next one, and
+        tabs built on an earlier open must re-read their stored values -
+        otherwise edits the user cancelled would still sit in the
+        widgets and get persisted by the next Save.
+        """
+        self.status_label.setVisible(False)
+        for index in self._built_tabs:
+            loader = self._tab_builders[index][2]
+            if loader:
+                try:
+                    loader()
+                except Exception as e:
+                    logger.error("Failed to load settings: %s", e)
+        super().showEvent(event)
+
+    def _ensure_tab(self, index: int):
+        """Build the tab at `index` on first view"""
+        if index in self._built_tabs:
+            return
+        self._built_tabs.add(index)
+
+        label, builder, loader = self._tab_builders[index]
+
+        # Swap the placeholder for the real widget
+        self.tabs.removeTab(index)
+        self.tabs.insertTab(index, builder(), label)
+        self.tabs.setCurrentIndex(index)
+
+        if loader:
+            try:
+                loader()
+            except Exception as e:
+                logger.error("Failed to load settings: %s", e)
+
+    def _add_spin_rows(self, layout: QFormLayout, rows):
+        """Build QSpinBox rows from (attr, label, lo, hi, suffix) tuples"""
+        for attr, label, lo, hi, suffix in rows:
+            spin = QSpinBox()
+            # setRange reinstalls the validator and re-edits the line
+            # edit; skip it when the bounds match Qt's 0..99 default
+            if (lo, hi) != (0, 99):
+                spin.setRange(lo, hi)
+            if suffix:
+                spin.setSuffix(suffix)
+            setattr(self, attr, spin)
+            layout.addRow(label, spin)
+
+    def _add_combo_rows(self, layout: QFormLayout, rows):
+        """Build QComboBox rows from (attr, label, items) tuples"""
+        for attr, label, items in rows:
+            combo = QComboBox()
+            combo.addItems(items)
+            setattr(self, attr, combo)
+            layout.addRow(label, combo)
+
+    def _add_check_rows(self, layout: QFormLayout, rows):
+        """Build QCheckBox rows from (attr, label, text) tuples"""
+        for attr, label, text in rows:
+            check = QCheckBox(text)
+            setattr(self, attr, check)
+            layout.addRow(label, check)
+
     def _create_general_tab(self) -> QWidget:
         """Create General settings tab"""
         widget = QWidget()
@@ -70,45 +183,33 @@ class SettingsDialog(QDialog):
         # Application group
         app_group = QGroupBox("Application")
         app_layout = QFormLayout(app_group)
-        
-        self.launch_on_startup = QCheckBox("Launch on system startup")
-        app_layout.addRow("Startup:", self.launch_on_startup)
-        
-        self.minimize_to_tray = QCheckBox("Minimize to system tray")
-        app_layout.addRow("Minimize:", self.minimize_to_tray)
-        
-        self.close_to_tray = QCheckBox("Close to tray instead of exit")
-        app_layout.addRow("Close:", self.close_to_tray)
-        
+        self._add_check_rows(app_layout, [
+            ('launch_on_startup', "Startup:", "Launch on system startup"),
+            ('minimize_to_tray', "Minimize:", "Minimize to system tray"),
+            ('close_to_tray', "Close:", "Close to tray instead of exit"),
+        ])
         layout.addWidget(app_group)
-        
+
         # Updates group
         updates_group = QGroupBox("Updates")
         updates_layout = QFormLayout(updates_group)
-        
-        self.auto_check_updates = QCheckBox("Automatically check for updates")
-        updates_layout.addRow("Auto-check:", self.auto_check_updates)
-        
-        self.update_frequency = QComboBox()
-        self.update_frequency.addItems(["Daily", "Weekly", "Monthly", "Never"])
-        updates_layout.addRow("Frequency:", self.update_frequency)
-        
+        self._add_check_rows(updates_layout, [
+            ('auto_check_updates', "Auto-check:", "Automatically check for updates"),
+        ])
+        self._add_combo_rows(updates_layout, [
+            ('update_frequency', "Frequency:", ["Daily", "Weekly", "Monthly", "Never"]),
+        ])
         layout.addWidget(updates_group)
-        
+
         # View preferences
         view_group = QGroupBox("View Preferences")
         view_layout = QFormLayout(view_group)
-        
-        self.default_view = QComboBox()
-        self.default_view.addItems(["Grid View", "List View", "Detail View"])
-        view_layout.addRow("Default View:", self.default_view)
-        
-        self.sort_by = QComboBox()
-        self.sort_by.addItems(["Title", "Last Played", "Date Added", "Developer"])
-        view_layout.addRow("Sort By:", self.sort_by)
-        
+        self._add_combo_rows(view_layout, [
+            ('default_view', "Default View:", ["Grid View", "List View", "Detail View"]),
+            ('sort_by', "Sort By:", ["Title", "Last Played", "Date Added", "Developer"]),
+        ])
         layout.addWidget(view_group)
-        
+
         layout.addStretch()
         return widget
     
@@ -121,27 +222,23 @@ class SettingsDialog(QDialog):
         # Theme group
         theme_group = QGroupBox("Theme")
         theme_layout = QFormLayout(theme_group)
-        
-        self.theme_combo = QComboBox()
-        self.theme_combo.addItems(["Dark", "Light", "System"])
-        theme_layout.addRow("Theme:", self.theme_combo)
-        
+        self._add_combo_rows(theme_layout, [
+            ('theme_combo', "Theme:", ["Dark", "Light", "System"]),
+        ])
+
         theme_preview = QLabel("Theme will be applied when you save settings.")
         theme_preview.setObjectName("subheadingLabel")
         theme_preview.setWordWrap(True)
         theme_layout.addRow("", theme_preview)
-        
+
         layout.addWidget(theme_group)
-        
+
         # Font group
         font_group = QGroupBox("Font")
         font_layout = QFormLayout(font_group)
-        
-        self.font_size = QSpinBox()
-        self.font_size.setRange(10, 20)
-        self.font_size.setSuffix(" pt")
-        font_layout.addRow("Font Size:", self.font_size)
-        
+        self._add_spin_rows(font_layout, [
+            ('font_size', "Font Size:", 10, 20, " pt"),
+        ])
         layout.addWidget(font_group)
         
         # Grid settings
@@ -155,8 +252,17 @@ class SettingsDialog(QDialog):
         self.card_size_slider.setTickInterval(50)
         
         self.card_size_label = QLabel("280")
+
+        # Coalesce label updates to ~60 Hz; a drag emits valueChanged per
+        # integer tick and each setText can relayout the form row
+        self._card_label_timer = QTimer(self)
+        self._card_label_timer.setSingleShot(True)
+        self._card_label_timer.setInterval(16)
+        self._card_label_timer.timeout.connect(
+            lambda: self.card_size_label.setText(str(self.card_size_slider.value()))
+        )
         self.card_size_slider.valueChanged.connect(
-            lambda v: self.card_size_label.setText(str(v))
+            lambda _: self._card_label_timer.start()
         )
         
         size_layout = QHBoxLayout()
@@ -164,11 +270,10 @@ class SettingsDialog(QDialog):
         size_layout.addWidget(self.card_size_label)
         
         grid_layout.addRow("Card Size:", size_layout)
-        
-        self.grid_columns = QSpinBox()
-        self.grid_columns.setRange(2, 8)
-        grid_layout.addRow("Columns:", self.grid_columns)
-        
+
+        self._add_spin_rows(grid_layout, [
+            ('grid_columns', "Columns:", 2, 8, ""),
+        ])
         layout.addWidget(grid_group)
         
         layout.addStretch()
@@ -183,30 +288,22 @@ class SettingsDialog(QDialog):
         # Download group
         download_group = QGroupBox("Download Settings")
         download_layout = QFormLayout(download_group)
-        
-        self.concurrent_downloads = QSpinBox()
-        self.concurrent_downloads.setRange(1, 5)
-        download_layout.addRow("Concurrent Downloads:", self.concurrent_downloads)
-        
-        self.download_speed_limit = QSpinBox()
-        self.download_speed_limit.setRange(0, 10000)
-        self.download_speed_limit.setSuffix(" KB/s (0 = unlimited)")
-        download_layout.addRow("Speed Limit:", self.download_speed_limit)
-        
-        self.auto_extract = QCheckBox("Automatically extract archives")
-        download_layout.addRow("Auto Extract:", self.auto_extract)
-        
+        self._add_spin_rows(download_layout, [
+            ('concurrent_downloads', "Concurrent Downloads:", 1, 5, ""),
+            ('download_speed_limit', "Speed Limit:", 0, 10000, " KB/s (0 = unlimited)"),
+        ])
+        self._add_check_rows(download_layout, [
+            ('auto_extract', "Auto Extract:", "Automatically extract archives"),
+        ])
         layout.addWidget(download_group)
-        
+
         # Cache group
         cache_group = QGroupBox("Cache")
         cache_layout = QFormLayout(cache_group)
-        
-        self.cache_size = QSpinBox()
-        self.cache_size.setRange(100, 10000)
-        self.cache_size.setSuffix(" MB")
-        cache_layout.addRow("Cache Size:", self.cache_size)
-        
+        self._add_spin_rows(cache_layout, [
+            ('cache_size', "Cache Size:", 100, 10000, " MB"),
+        ])
+
         clear_cache_btn = QPushButton("Clear Cache Now")
         clear_cache_btn.setObjectName("dangerButton")
         clear_cache_btn.clicked.connect(self._clear_cache)
@@ -226,14 +323,12 @@ class SettingsDialog(QDialog):
         # Debug group
         debug_group = QGroupBox("Debug")
         debug_layout = QFormLayout(debug_group)
-        
-        self.debug_mode = QCheckBox("Enable debug mode")
-        debug_layout.addRow("Debug:", self.debug_mode)
-        
-        self.log_level = QComboBox()
-        self.log_level.addItems(["DEBUG", "INFO", "WARNING", "ERROR"])
-        debug_layout.addRow("Log Level:", self.log_level)
-        
+        self._add_check_rows(debug_layout, [
+            ('debug_mode', "Debug:", "Enable debug mode"),
+        ])
+        self._add_combo_rows(debug_layout, [
+            ('log_level', "Log Level:", ["DEBUG", "INFO", "WARNING", "ERROR"]),
+        ])
         layout.addWidget(debug_group)
         
         # Database group
@@ -253,16 +348,10 @@ class SettingsDialog(QDialog):
         # Scraper settings
         scraper_group = QGroupBox("Scraper")
         scraper_layout = QFormLayout(scraper_group)
-        
-        self.scraper_delay = QSpinBox()
-        self.scraper_delay.setRange(1, 10)
-        self.scraper_delay.setSuffix(" seconds")
-        scraper_layout.addRow("Delay Between Requests:", self.scraper_delay)
-        
-        self.max_retries = QSpinBox()
-        self.max_retries.setRange(1, 10)
-        scraper_layout.addRow("Max Retries:", self.max_retries)
-        
+        self._add_spin_rows(scraper_layout, [
+            ('scraper_delay', "Delay Between Requests:", 1, 10, " seconds"),
+            ('max_retries', "Max Retries:", 1, 10, ""),
+        ])
         layout.addWidget(scraper_group)
         
         layout.addStretch()
@@ -300,78 +389,91 @@ class SettingsDialog(QDialog):
         layout.addStretch()
         return widget
     
-    def _load_settings(self):
-        """Load current settings"""
-        try:
-            # General
-            self.launch_on_startup.setChecked(
-                self.settings.get('launch_on_startup', False)
-            )
-            self.minimize_to_tray.setChecked(
-                self.settings.get('minimize_to_tray', True)
-            )
-            self.close_to_tray.setChecked(
-                self.settings.get('close_to_tray', False)
-            )
-            self.auto_check_updates.setChecked(
-                self.settings.get('auto_check_updates', True)
-            )
-            
-            # Appearance
-            theme = self.settings.get('theme', 'dark')
-            self.theme_combo.setCurrentText(theme.capitalize())
-            self.font_size.setValue(self.settings.get('font_size', 13))
-            self.grid_columns.setValue(self.settings.get('grid_columns', 4))
-            
-            # Downloads
-            self.concurrent_downloads.setValue(
-                self.settings.get('concurrent_downloads', 3)
-            )
-            self.cache_size.setValue(self.settings.get('cache_size_mb', 1000))
-            self.auto_extract.setChecked(self.settings.get('auto_extract', True))
-            
-            # Advanced
-            self.debug_mode.setChecked(self.settings.get('debug_mode', False))
-            self.scraper_delay.setValue(self.settings.get('scraper_delay', 2))
-            self.max_retries.setValue(self.settings.get('max_retries', 3))
-            
-        except Exception as e:
-            logger.error(f"Failed to load settings: {e}")
-    
+    def _get_settings(self, keys) -> dict:
+        """Batch-fetch settings for one tab with their defaults"""
+        return self.settings.get_many({k: SETTINGS_DEFAULTS[k] for k in keys})
+
+    def _load_general_settings(self):
+        """Load settings for the General tab"""
+        values = self._get_settings(_GENERAL_KEYS)
+        self.launch_on_startup.setChecked(values['launch_on_startup'])
+        self.minimize_to_tray.setChecked(values['minimize_to_tray'])
+        self.close_to_tray.setChecked(values['close_to_tray'])
+        self.auto_check_updates.setChecked(values['auto_check_updates'])
+
+    def _load_appearance_settings(self):
+        """Load settings for the Appearance tab"""
+        values = self._get_settings(_APPEARANCE_KEYS)
+        self.theme_combo.setCurrentText(values['theme'].capitalize())
+        self.font_size.setValue(values['font_size'])
+        self.grid_columns.setValue(values['grid_columns'])
+
+    def _load_downloads_settings(self):
+        """Load settings for the Downloads tab"""
+        values = self._get_settings(_DOWNLOADS_KEYS)
+        self.concurrent_downloads.setValue(values['concurrent_downloads'])
+        self.cache_size.setValue(values['cache_size_mb'])
+        self.auto_extract.setChecked(values['auto_extract'])
+
+    def _load_advanced_settings(self):
+        """Load settings for the Advanced tab"""
+        values = self._get_settings(_ADVANCED_KEYS)
+        self.debug_mode.setChecked(values['debug_mode'])
+        self.scraper_delay.setValue(values['scraper_delay'])
+        self.max_retries.setValue(values['max_retries'])
+
     def _save_settings(self):
-        """Save settings"""
+        """Save settings (only tabs the user actually opened exist)"""
         try:
-            # General
-            self.settings.set('launch_on_startup', self.launch_on_startup.isChecked())
-            self.settings.set('minimize_to_tray', self.minimize_to_tray.isChecked())
-            self.settings.set('close_to_tray', self.close_to_tray.isChecked())
-            self.settings.set('auto_check_updates', self.auto_check_updates.isChecked())
-            
-            # Appearance
-            theme = self.theme_combo.currentText().lower()
-            self.settings.set('theme', theme)
-            self.settings.set('font_size', self.font_size.value())
-            self.settings.set('grid_columns', self.grid_columns.value())
-            
-            # Downloads
-            self.settings.set('concurrent_downloads', self.concurrent_downloads.value())
-            self.settings.set('cache_size_mb', self.cache_size.value())
-            self.settings.set('auto_extract', self.auto_extract.isChecked())
-            
-            # Advanced
-            self.settings.set('debug_mode', self.debug_mode.isChecked())
-            self.settings.set('scraper_delay', self.scraper_delay.value())
-            self.settings.set('max_retries', self.max_retries.value())
-            
+            payload = {}
+
+            if 0 in self._built_tabs:
+                # General
+                payload['launch_on_startup'] = self.launch_on_startup.isChecked()
+                payload['minimize_to_tray'] = self.minimize_to_tray.isChecked()
+                payload['close_to_tray'] = self.close_to_tray.isChecked()
+                payload['auto_check_updates'] = self.auto_check_updates.isChecked()
+
+            if 1 in self._built_tabs:
+                # Appearance
+                payload['theme'] = self.theme_combo.currentText().lower()
+                payload['font_size'] = self.font_size.value()
+                payload['grid_columns'] = self.grid_columns.value()
+
+            if 2 in self._built_tabs:
+                # Downloads
+                payload['concurrent_downloads'] = self.concurrent_downloads.value()
+                payload['cache_size_mb'] = self.cache_size.value()
+                payload['auto_extract'] = self.auto_extract.isChecked()
+
+            if 3 in self._built_tabs:
+                # Advanced
+                payload['debug_mode'] = self.debug_mode.isChecked()
+                payload['scraper_delay'] = self.scraper_delay.value()
+                payload['max_retries'] = self.max_retries.value()
+
+            # Snapshot stored values so we only signal real changes; a
+            # theme_changed emit triggers a full stylesheet reload downstream
+            old_values = {key: self.settings.get(key) for key in payload}
+
+            # One write, one commit
+            self.settings.update(payload)
+
+            dirty = {key for key, value in payload.items()
+                     if old_values.get(key) != value}
+
             # Emit signals
-            self.theme_changed.emit(theme)
-            self.settings_changed.emit()
-            
-            QMessageBox.information(self, "Success", "Settings saved successfully!")
+            if 'theme' in dirty:
+                self.theme_changed.emit(payload['theme'])
+            if dirty:
+                self.settings_changed.emit()
+
+            # The saved confirmation is shown by the main window's
+            # status bar - a toast here would die with the dialog
             self.accept()
-            
+
         except Exception as e:
-            logger.error(f"Failed to save settings: {e}")
+            logger.error("Failed to save settings: %s", e)
             QMessageBox.critical(self, "Error", f"Failed to save settings: {e}")
     
     def _clear_cache(self):
@@ -385,23 +487,35 @@ class SettingsDialog(QDialog):
         
         if reply == QMessageBox.StandardButton.Yes:
             # TODO: Implement cache clearing
-            QMessageBox.information(self, "Success", "Cache cleared!")
+            self._toast("Cache cleared")
     
-    def _optimize_database(self):
-        """Optimize database"""
+    @asyncSlot()
+    async def _optimize_database(self):
+        """Optimize database (blocking work runs off the UI thread)"""
         try:
-            # TODO: Implement database optimization
-            QMessageBox.information(self, "Success", "Database optimized!")
+            await asyncio.get_event_loop().run_in_executor(None, self._do_optimize)
+            self._toast("Database optimized")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to optimize database: {e}")
-    
-    def _backup_database(self):
-        """Backup database"""
+
+    def _do_optimize(self):
+        """Blocking VACUUM/ANALYZE work; runs on a worker thread"""
+        # TODO: Implement database optimization
+        pass
+
+    @asyncSlot()
+    async def _backup_database(self):
+        """Backup database (blocking work runs off the UI thread)"""
         try:
-            # TODO: Implement database backup
-            QMessageBox.information(self, "Success", "Database backed up!")
+            await asyncio.get_event_loop().run_in_executor(None, self._do_backup)
+            self._toast("Database backed up")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to backup database: {e}")
+
+    def _do_backup(self):
+        """Blocking backup copy; runs on a worker thread"""
+        # TODO: Implement database backup
+        pass
     
     def _logout(self):
         """Logout"""
@@ -414,4 +528,4 @@ class SettingsDialog(QDialog):
         
         if reply == QMessageBox.StandardButton.Yes:
             # TODO: Implement logout
-            QMessageBox.information(self, "Logged Out", "You have been logged out.")
+            self._toast("You have been logged out")
@@ -1,16 +1,22 @@
 """
 Main application window - Complete redesign with modern UI
 """
+import asyncio
+import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from PyQt6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QStatusBar, QMessageBox,
-    QTableWidget, QTableWidgetItem, QHeaderView, QMenu,
+    QTableView, QHeaderView, QMenu,
     QLineEdit, QComboBox, QStackedWidget, QScrollArea,
     QFrame, QSplitter
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtCore import (
+    Qt, pyqtSignal, QTimer, QSignalBlocker, QAbstractTableModel, QModelIndex
+)
 from PyQt6.QtGui import QAction
+from qasync import asyncSlot
 
 from lewdcorner.core.auth.auth_service import AuthService
 from lewdcorner.core.db.database import DatabaseManager
@@ -23,9 +29,114 @@ from lewdcorner.ui.qss import load_theme
 
 logger = logging.getLogger(__name__)
 
+# One worker serializes queries on the shared SQLite connection while
+# keeping them off the Qt thread
+_DB_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db")
+
+
+def _as_dict(game) -> dict:
+    """
+    Convert a Game to its dict form, caching on the instance
+
+    Grid/list switches redisplay the same objects; without the cache
+    every switch re-runs to_dict() over the whole library.
+    """
+    if isinstance(game, dict):
+        return game
+    cached = getattr(game, '_cached_dict', None)
+    if cached is None:
+        cached = game.to_dict()
+        game._cached_dict = cached
+    return cached
+
+
+class GameTableModel(QAbstractTableModel):
+    """
+    List-view model over the displayed games
+
+    Cells are computed on demand in data(), so populating the view is
+    one model reset instead of 7·N QTableWidgetItem allocations.
+    """
+
+    HEADERS = ("Title", "Version", "Engine", "Status", "Developer",
+               "Last Update", "Actions")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.games = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.games)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (orientation == Qt.Orientation.Horizontal
+                and role == Qt.ItemDataRole.DisplayRole):
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        game_dict = _as_dict(self.games[index.row()])
+
+        if role == Qt.ItemDataRole.UserRole:
+            return game_dict.get('id')
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            col = index.column()
+            if col == 0:
+                return game_dict.get('title', '')
+            if col == 1:
+                return game_dict.get('version', '') or 'Unknown'
+            if col == 2:
+                return game_dict.get('engine', '') or 'Unknown'
+            if col == 3:
+                return game_dict.get('status', '') or 'Unknown'
+            if col == 4:
+                return game_dict.get('developer', '') or 'Unknown'
+            if col == 5:
+                last_update = game_dict.get('last_update')
+                return str(last_update) if last_update else ''
+
+        return None
+
+    def game_id_at(self, row: int):
+        """Get the game id for a row"""
+        if 0 <= row < len(self.games):
+            return _as_dict(self.games[row]).get('id')
+        return None
+
+    def set_games(self, games: list):
+        """Swap in a new game list with a single model reset"""
+        self.beginResetModel()
+        self.games = games
+        self.endResetModel()
+
+    def refresh_row(self, row: int):
+        """Announce that one game's cells changed"""
+        if 0 <= row < len(self.games):
+            self.dataChanged.emit(
+                self.index(row, 0), self.index(row, len(self.HEADERS) - 1)
+            )
+
+    def remove_row(self, row: int):
+        """Remove one game from the model"""
+        if 0 <= row < len(self.games):
+            self.beginRemoveRows(QModelIndex(), row, row)
+            self.games.pop(row)
+            self.endRemoveRows()
+
 
 class MainWindow(QMainWindow):
     """Main application window with modern UI"""
+
+    # All load paths funnel through this queued signal so rapid
+    # successive loads collapse into event-loop-ordered displays
+    games_loaded = pyqtSignal(list)
     
     def __init__(self, auth_service: AuthService, db_manager: DatabaseManager):
         super().__init__()
@@ -38,6 +149,28 @@ class MainWindow(QMainWindow):
         self.scraper_worker = None
         self.current_view = "grid"  # grid or list
         self.current_games = []
+        self._games_by_id = {}  # id -> Game, rebuilt on each display
+        self._settings_dialog = None  # built on first open, then reused
+        self._row_menu = None  # context menu, built on first right-click
+
+        self._load_token = 0  # drops stale off-thread query results
+
+        # Only the visible view is populated; the hidden one is
+        # marked dirty and rebuilt on the next switch
+        self._view_dirty = {'grid': False, 'list': False}
+
+        # Collapse per-keystroke search into one query per typing burst
+        self._pending_search = ""
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(250)
+        self._search_timer.timeout.connect(self._do_search)
+
+        # Loaded off-thread right after startup; afterwards
+        # NotificationService pushes changes via unread_count_changed,
+        # so view refreshes never hit SQLite for it
+        self._unread_count = 0
+        self._notif_cache = None  # preview rows, dropped when unread changes
         
         self.setWindowTitle("LewdCornerLauncher")
         self.resize(1600, 1000)
@@ -49,6 +182,7 @@ class MainWindow(QMainWindow):
         self._connect_signals()
         
         # Load initial data
+        QTimer.singleShot(0, self._load_unread_count)
         QTimer.singleShot(100, self.refresh_library)
     
     def _apply_theme(self):
@@ -96,8 +230,9 @@ class MainWindow(QMainWindow):
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Ready")
         
-        # Menu bar
-        self._create_menu_bar()
+        # Menu bar - built right after the window paints; it isn't
+        # needed for first frame and its QAction setup is not free
+        QTimer.singleShot(0, self._create_menu_bar)
     
     def _create_header(self) -> QWidget:
         """Create modern header with account info"""
@@ -111,24 +246,22 @@ class MainWindow(QMainWindow):
         # Logo/Title
         title_container = QVBoxLayout()
         title = QLabel("LewdCorner")
-        title.setObjectName("sidebarTitle")
-        title.setStyleSheet("background: transparent; border: none; font-size: 24px;")
+        title.setObjectName("headerTitle")
         title_container.addWidget(title)
-        
+
         subtitle = QLabel("Game Library Manager")
-        subtitle.setObjectName("subheadingLabel")
-        subtitle.setStyleSheet("font-size: 11px; color: #909090;")
+        subtitle.setObjectName("headerSubtitle")
         title_container.addWidget(subtitle)
         
         layout.addLayout(title_container)
         layout.addStretch()
         
         # Notification icon
-        notif_btn = QPushButton(f"🔔 {self.db.get_unread_count()}")
-        notif_btn.setObjectName("secondaryButton")
-        notif_btn.setFixedHeight(40)
-        notif_btn.clicked.connect(self.show_notifications)
-        layout.addWidget(notif_btn)
+        self._notif_btn = QPushButton(f"🔔 {self._unread_count}")
+        self._notif_btn.setObjectName("secondaryButton")
+        self._notif_btn.setFixedHeight(40)
+        self._notif_btn.clicked.connect(self.show_notifications)
+        layout.addWidget(self._notif_btn)
         
         # Account info
         account_container = QHBoxLayout()
@@ -162,7 +295,7 @@ class MainWindow(QMainWindow):
         
         # Navigation label
         nav_label = QLabel("LIBRARY")
-        nav_label.setStyleSheet("color: #909090; font-size: 11px; font-weight: 600; padding: 10px 10px 5px 10px;")
+        nav_label.setObjectName("navSectionLabel")
         nav_layout.addWidget(nav_label)
         
         # Navigation buttons
@@ -186,7 +319,7 @@ class MainWindow(QMainWindow):
         
         # Collections label
         coll_label = QLabel("COLLECTIONS")
-        coll_label.setStyleSheet("color: #909090; font-size: 11px; font-weight: 600; padding: 10px 10px 5px 10px;")
+        coll_label.setObjectName("navSectionLabel")
         nav_layout.addWidget(coll_label)
         
         self.btn_collections = self._create_nav_button("📁 My Collections")
@@ -197,12 +330,14 @@ class MainWindow(QMainWindow):
         
         # Stats label
         stats_label = QLabel("STATISTICS")
-        stats_label.setStyleSheet("color: #909090; font-size: 11px; font-weight: 600; padding: 10px 10px 5px 10px;")
+        stats_label.setObjectName("navSectionLabel")
         nav_layout.addWidget(stats_label)
         
         self.btn_stats = self._create_nav_button("📊 Statistics")
         self.btn_stats.clicked.connect(self.show_statistics)
         nav_layout.addWidget(self.btn_stats)
+
+        self._active_nav = self.btn_all_games
         
         layout.addWidget(nav_container)
         layout.addStretch()
@@ -239,15 +374,17 @@ class MainWindow(QMainWindow):
     
     def _set_active_nav_button(self, button: QPushButton):
         """Set active navigation button"""
-        for btn in [self.btn_all_games, self.btn_favorites, self.btn_recent, 
-                    self.btn_bookmarks, self.btn_collections, self.btn_stats]:
-            btn.setProperty("active", False)
+        if button is self._active_nav:
+            return
+
+        # Restyle only the button that lost the state and the one that
+        # gained it; unpolish/polish re-runs QSS matching per widget
+        for btn, active in ((self._active_nav, False), (button, True)):
+            btn.setProperty("active", active)
             btn.style().unpolish(btn)
             btn.style().polish(btn)
-        
-        button.setProperty("active", True)
-        button.style().unpolish(button)
-        button.style().polish(button)
+
+        self._active_nav = button
     
     def _create_content_area(self) -> QWidget:
         """Create main content area"""
@@ -269,10 +406,10 @@ class MainWindow(QMainWindow):
         self.grid_view.play_clicked.connect(self.on_play_game)
         self.view_stack.addWidget(self.grid_view)
         
-        # List view (table)
-        self.list_view = self._create_list_view()
-        self.view_stack.addWidget(self.list_view)
-        
+        # List view (table) is built on first switch - most sessions
+        # never leave the grid, so don't pay for the table upfront
+        self.list_view = None
+
         layout.addWidget(self.view_stack)
         
         return container
@@ -320,15 +457,17 @@ class MainWindow(QMainWindow):
         # View toggle buttons
         self.btn_grid_view = QPushButton("▦ Grid")
         self.btn_grid_view.setFixedHeight(40)
-        self.btn_grid_view.clicked.connect(lambda: self.switch_view("grid"))
+        self.btn_grid_view.clicked.connect(functools.partial(self.switch_view, "grid"))
         layout.addWidget(self.btn_grid_view)
         
         self.btn_list_view = QPushButton("☰ List")
         self.btn_list_view.setObjectName("secondaryButton")
         self.btn_list_view.setFixedHeight(40)
-        self.btn_list_view.clicked.connect(lambda: self.switch_view("list"))
+        self.btn_list_view.clicked.connect(functools.partial(self.switch_view, "list"))
         layout.addWidget(self.btn_list_view)
-        
+
+        self._active_view_btn = self.btn_grid_view
+
         return toolbar
     
     def _create_list_view(self) -> QWidget:
@@ -337,16 +476,15 @@ class MainWindow(QMainWindow):
         layout = QVBoxLayout(container)
         layout.setContentsMargins(20, 20, 20, 20)
         
-        self.game_table = QTableWidget()
-        self.game_table.setColumnCount(7)
-        self.game_table.setHorizontalHeaderLabels(
-            ["Title", "Version", "Engine", "Status", "Developer", "Last Update", "Actions"]
-        )
+        self._list_model = GameTableModel(self)
+
+        self.game_table = QTableView()
+        self.game_table.setModel(self._list_model)
         self.game_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        self.game_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self.game_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
         self.game_table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
         self.game_table.customContextMenuRequested.connect(self.show_context_menu)
-        self.game_table.cellDoubleClicked.connect(self.on_table_double_clicked)
+        self.game_table.doubleClicked.connect(self.on_table_double_clicked)
         self.game_table.setAlternatingRowColors(True)
         
         layout.addWidget(self.game_table)
@@ -394,11 +532,11 @@ class MainWindow(QMainWindow):
         view_menu = menubar.addMenu("View")
         
         grid_action = QAction("Grid View", self)
-        grid_action.triggered.connect(lambda: self.switch_view("grid"))
+        grid_action.triggered.connect(functools.partial(self.switch_view, "grid"))
         view_menu.addAction(grid_action)
         
         list_action = QAction("List View", self)
-        list_action.triggered.connect(lambda: self.switch_view("list"))
+        list_action.triggered.connect(functools.partial(self.switch_view, "list"))
         view_menu.addAction(list_action)
         
         # Help menu
@@ -410,105 +548,181 @@ class MainWindow(QMainWindow):
     
     def _connect_signals(self):
         """Connect internal signals"""
-        pass
+        self.notifications.unread_count_changed.connect(self._on_unread_changed)
+        self.games_loaded.connect(
+            self._display_games, type=Qt.ConnectionType.QueuedConnection
+        )
+
+    def _on_unread_changed(self, count: int):
+        """Update the cached unread count and the header badge"""
+        self._unread_count = count
+        self._notif_cache = None
+        self._notif_btn.setText(f"🔔 {count}")
+
+    @asyncSlot()
+    async def _load_unread_count(self):
+        """Fetch the initial unread count without blocking startup"""
+        count = await asyncio.get_event_loop().run_in_executor(
+            _DB_EXECUTOR, self.db.get_unread_count
+        )
+        self._on_unread_changed(count)
     
     # === View Management ===
     
     def switch_view(self, view_type: str):
         """Switch between grid and list view"""
         self.current_view = view_type
-        
+
+        if view_type == "list" and self.list_view is None:
+            self.list_view = self._create_list_view()
+            self.view_stack.addWidget(self.list_view)
+
         if view_type == "grid":
             self.view_stack.setCurrentIndex(0)
-            self.btn_grid_view.setObjectName("")
-            self.btn_list_view.setObjectName("secondaryButton")
+            active, inactive = self.btn_grid_view, self.btn_list_view
         else:
             self.view_stack.setCurrentIndex(1)
-            self.btn_list_view.setObjectName("")
-            self.btn_grid_view.setObjectName("secondaryButton")
-        
-        # Reapply styles
-        self.btn_grid_view.style().unpolish(self.btn_grid_view)
-        self.btn_grid_view.style().polish(self.btn_grid_view)
-        self.btn_list_view.style().unpolish(self.btn_list_view)
-        self.btn_list_view.style().polish(self.btn_list_view)
-        
-        # Refresh display
-        self._display_games(self.current_games)
+            active, inactive = self.btn_list_view, self.btn_grid_view
+
+        # Reapply styles only when the active toggle actually changed
+        if active is not self._active_view_btn:
+            self._active_view_btn = active
+            active.setObjectName("")
+            inactive.setObjectName("secondaryButton")
+            for btn in (active, inactive):
+                btn.style().unpolish(btn)
+                btn.style().polish(btn)
+
+        # Refresh the target view only if it missed updates while hidden
+        if self._view_dirty[view_type]:
+            self._display_games(self.current_games)
     
     def _display_games(self, games: list):
         """Display games in current view"""
         self.current_games = games
+        self._games_by_id = {
+            (g.get('id') if isinstance(g, dict) else g.id): g for g in games
+        }
         
         if self.current_view == "grid":
             # Convert to dict format
-            games_data = [g.to_dict() if hasattr(g, 'to_dict') else g for g in games]
+            games_data = [_as_dict(g) for g in games]
             self.grid_view.set_games(games_data)
+            self._view_dirty['grid'] = False
+            self._view_dirty['list'] = True
         else:
             self._populate_table(games)
+            self._view_dirty['list'] = False
+            self._view_dirty['grid'] = True
     
     def _populate_table(self, games):
         """Populate table with games"""
-        self.game_table.setRowCount(0)
-        
-        for game in games:
-            row = self.game_table.rowCount()
-            self.game_table.insertRow(row)
-            
-            game_dict = game.to_dict() if hasattr(game, 'to_dict') else game
-            
-            self.game_table.setItem(row, 0, QTableWidgetItem(game_dict.get('title', '')))
-            self.game_table.setItem(row, 1, QTableWidgetItem(game_dict.get('version', '') or 'Unknown'))
-            self.game_table.setItem(row, 2, QTableWidgetItem(game_dict.get('engine', '') or 'Unknown'))
-            self.game_table.setItem(row, 3, QTableWidgetItem(game_dict.get('status', '') or 'Unknown'))
-            self.game_table.setItem(row, 4, QTableWidgetItem(game_dict.get('developer', '') or 'Unknown'))
-            self.game_table.setItem(row, 5, QTableWidgetItem(
-                str(game_dict.get('last_update', '')) if game_dict.get('last_update') else ''
-            ))
-            
-            # Store game ID
-            self.game_table.item(row, 0).setData(
-                Qt.ItemDataRole.UserRole, 
-                game_dict.get('id')
-            )
+        # The model wraps the displayed list directly; filling the
+        # view is one model reset, not a per-cell setItem loop
+        self._list_model.set_games(games)
+
+    def _patch_game(self, row: int, game):
+        """Update one game in place instead of reloading the library"""
+        # Callers reach here after mutating the instance (e.g. a
+        # favorite toggle), so the memoized dict is stale by definition
+        if not isinstance(game, dict):
+            game._cached_dict = None
+        game_dict = _as_dict(game)
+        game_id = game_dict.get('id')
+
+        self._games_by_id[game_id] = game
+        for i, existing in enumerate(self.current_games):
+            existing_id = existing.get('id') if isinstance(existing, dict) else existing.id
+            if existing_id == game_id:
+                self.current_games[i] = game
+                break
+
+        # The model shares current_games, so it only needs the change
+        # announced for the affected row
+        if self.list_view is not None:
+            self._list_model.refresh_row(row)
+        self.grid_view.update_game(game_dict)
     
     # === Data Loading ===
-    
-    def refresh_library(self):
+
+    async def _load_games(self, fetch):
+        """
+        Run a blocking DB fetch off-thread and display the result
+
+        Each call bumps a token; a stale result that lands after a
+        newer request started is dropped instead of overwriting the
+        fresher view. Returns the games, or None if superseded.
+        """
+        self._load_token += 1
+        token = self._load_token
+        games = await asyncio.get_event_loop().run_in_executor(
+            _DB_EXECUTOR, fetch
+        )
+        if token != self._load_token:
+            return None
+        self.games_loaded.emit(games)
+        return games
+
+    @asyncSlot()
+    async def refresh_library(self):
         """Refresh game library display"""
         try:
-            games = self.db.get_all_games()
-            self._display_games(games)
-            self.status_bar.showMessage(f"Loaded {len(games)} games")
+            games = await self._load_games(self.db.get_all_games)
+            if games is not None:
+                self.status_bar.showMessage(f"Loaded {len(games)} games")
         except Exception as e:
             logger.error(f"Failed to refresh library: {e}")
             QMessageBox.critical(self, "Error", f"Failed to load games: {e}")
-    
+
     def show_all_games(self):
         """Show all games"""
         self._set_active_nav_button(self.btn_all_games)
+
+        # Reset search and filters silently; letting textChanged /
+        # currentTextChanged fire here would queue redundant queries
+        # on top of the refresh below. An armed debounce must die with
+        # the text it captured, or it fires after the refresh and shows
+        # results for a search box that is now empty
+        self._search_timer.stop()
+        self._pending_search = ""
+        with QSignalBlocker(self.search_box):
+            self.search_box.clear()
+        with QSignalBlocker(self.filter_combo):
+            self.filter_combo.setCurrentIndex(0)
+        with QSignalBlocker(self.engine_filter):
+            self.engine_filter.setCurrentIndex(0)
+
         self.refresh_library()
-    
-    def show_favorites(self):
+
+    @asyncSlot()
+    async def show_favorites(self):
         """Show favorites"""
         self._set_active_nav_button(self.btn_favorites)
-        games = self.db.filter_games({'is_favorite': True})
-        self._display_games(games)
-        self.status_bar.showMessage(f"Showing {len(games)} favorites")
-    
-    def show_recently_played(self):
+        games = await self._load_games(
+            functools.partial(self.db.filter_games, {'is_favorite': True})
+        )
+        if games is not None:
+            self.status_bar.showMessage(f"Showing {len(games)} favorites")
+
+    @asyncSlot()
+    async def show_recently_played(self):
         """Show recently played"""
         self._set_active_nav_button(self.btn_recent)
-        games = self.db.get_recently_played(50)
-        self._display_games(games)
-        self.status_bar.showMessage(f"Showing {len(games)} recently played games")
-    
-    def show_bookmarks(self):
+        games = await self._load_games(
+            functools.partial(self.db.get_recently_played, 50)
+        )
+        if games is not None:
+            self.status_bar.showMessage(f"Showing {len(games)} recently played games")
+
+    @asyncSlot()
+    async def show_bookmarks(self):
         """Show bookmarked games"""
         self._set_active_nav_button(self.btn_bookmarks)
-        games = self.db.filter_games({'is_bookmarked': True})
-        self._display_games(games)
-        self.status_bar.showMessage(f"Showing {len(games)} bookmarked games")
+        games = await self._load_games(
+            functools.partial(self.db.filter_games, {'is_bookmarked': True})
+        )
+        if games is not None:
+            self.status_bar.showMessage(f"Showing {len(games)} bookmarked games")
     
     def show_collections(self):
         """Show collections"""
@@ -522,12 +736,17 @@ class MainWindow(QMainWindow):
     
     def show_notifications(self):
         """Show notifications"""
-        unread = self.db.get_unread_notifications(20)
+        # Only the five previewed rows are fetched, and they're kept
+        # until the unread count changes
+        if self._notif_cache is None:
+            self._notif_cache = self.db.get_unread_notifications(5)
+
+        unread = self._notif_cache
         if not unread:
             QMessageBox.information(self, "Notifications", "No new notifications")
         else:
-            msg = "\n\n".join([f"{n.title}\n{n.message}" for n in unread[:5]])
-            QMessageBox.information(self, f"Notifications ({len(unread)})", msg)
+            msg = "\n\n".join(f"{n.title}\n{n.message}" for n in unread)
+            QMessageBox.information(self, f"Notifications ({self._unread_count})", msg)
     
     # === Scanning ===
     
@@ -540,7 +759,9 @@ class MainWindow(QMainWindow):
         self.scraper_worker = ScraperWorker(self.auth_service, self.db)
         self.scraper_worker.set_scan_type('forums', max_pages=3)
         self.scraper_worker.progress.connect(self.on_scan_progress)
-        self.scraper_worker.game_found.connect(self.on_game_found)
+        self.scraper_worker.games_batch.connect(
+            self.on_games_found, type=Qt.ConnectionType.QueuedConnection
+        )
         self.scraper_worker.finished_signal.connect(self.on_scan_finished)
         self.scraper_worker.error_occurred.connect(self.on_scan_error)
         
@@ -556,7 +777,9 @@ class MainWindow(QMainWindow):
         self.scraper_worker = ScraperWorker(self.auth_service, self.db)
         self.scraper_worker.set_scan_type('bookmarks', max_pages=10)
         self.scraper_worker.progress.connect(self.on_scan_progress)
-        self.scraper_worker.game_found.connect(self.on_game_found)
+        self.scraper_worker.games_batch.connect(
+            self.on_games_found, type=Qt.ConnectionType.QueuedConnection
+        )
         self.scraper_worker.finished_signal.connect(self.on_bookmark_scan_finished)
         self.scraper_worker.error_occurred.connect(self.on_scan_error)
         
@@ -567,8 +790,8 @@ class MainWindow(QMainWindow):
         """Handle scan progress"""
         self.status_bar.showMessage(f"{message} ({percent}%)")
     
-    def on_game_found(self, game_data: dict):
-        """Handle game found during scan"""
+    def on_games_found(self, games: list):
+        """Handle a batch of games found during scan"""
         pass
     
     def on_scan_finished(self, total_games: int):
@@ -593,47 +816,59 @@ class MainWindow(QMainWindow):
     # === Search and Filter ===
     
     def on_search(self, text: str):
-        """Handle search"""
+        """Debounce search keystrokes into a single query"""
+        self._pending_search = text
+        self._search_timer.start()
+
+    @asyncSlot()
+    async def _do_search(self):
+        """Run the search for the last text typed"""
+        text = self._pending_search
         if not text:
             self.refresh_library()
             return
-        
+
         try:
-            games = self.db.search_games(text)
-            self._display_games(games)
-            self.status_bar.showMessage(f"Found {len(games)} results")
+            games = await self._load_games(
+                functools.partial(self.db.search_games, text)
+            )
+            if games is not None:
+                self.status_bar.showMessage(f"Found {len(games)} results")
         except Exception as e:
             logger.error(f"Search error: {e}")
-    
-    def on_filter_changed(self, filter_text: str):
+
+    @asyncSlot(str)
+    async def on_filter_changed(self, filter_text: str):
         """Handle filter change"""
         try:
             filters = {}
-            
+
             # Main filter
             if filter_text == "Favorites":
                 filters['is_favorite'] = True
             elif filter_text == "Recently Played":
-                games = self.db.get_recently_played(50)
-                self._display_games(games)
+                await self._load_games(
+                    functools.partial(self.db.get_recently_played, 50)
+                )
                 return
             elif filter_text == "Completed":
                 filters['completed_status'] = 'Completed'
             elif filter_text == "Bookmarked":
                 filters['is_bookmarked'] = True
-            
+
             # Engine filter
             engine = self.engine_filter.currentText()
             if engine != "All Engines":
                 filters['engine'] = engine
-            
+
             if filters:
-                games = self.db.filter_games(filters)
+                fetch = functools.partial(self.db.filter_games, filters)
             else:
-                games = self.db.get_all_games()
-            
-            self._display_games(games)
-            self.status_bar.showMessage(f"Showing {len(games)} games")
+                fetch = self.db.get_all_games
+
+            games = await self._load_games(fetch)
+            if games is not None:
+                self.status_bar.showMessage(f"Showing {len(games)} games")
         except Exception as e:
             logger.error(f"Filter error: {e}")
     
@@ -641,28 +876,30 @@ class MainWindow(QMainWindow):
     
     def show_context_menu(self, position):
         """Show context menu for game"""
-        menu = QMenu()
-        
-        play_action = menu.addAction("▶ Play")
-        menu.addSeparator()
-        open_action = menu.addAction("🌐 Open in Browser")
-        fav_action = menu.addAction("⭐ Toggle Favorite")
-        refresh_action = menu.addAction("🔄 Refresh Metadata")
-        menu.addSeparator()
-        delete_action = menu.addAction("🗑️ Delete")
-        delete_action.setObjectName("dangerButton")
-        
-        action = menu.exec(self.game_table.viewport().mapToGlobal(position))
-        
-        if action == play_action:
+        if self._row_menu is None:
+            # Built once on first use; each QAction carries meta-object
+            # plumbing that doesn't need re-creating per right-click
+            self._row_menu = QMenu(self)
+            self._act_play = self._row_menu.addAction("▶ Play")
+            self._row_menu.addSeparator()
+            self._act_open = self._row_menu.addAction("🌐 Open in Browser")
+            self._act_fav = self._row_menu.addAction("⭐ Toggle Favorite")
+            self._act_refresh = self._row_menu.addAction("🔄 Refresh Metadata")
+            self._row_menu.addSeparator()
+            self._act_delete = self._row_menu.addAction("🗑️ Delete")
+            self._act_delete.setObjectName("dangerButton")
+
+        action = self._row_menu.exec(self.game_table.viewport().mapToGlobal(position))
+
+        if action is self._act_play:
             self.play_selected_game()
-        elif action == open_action:
+        elif action is self._act_open:
             self.open_game_in_browser()
-        elif action == fav_action:
+        elif action is self._act_fav:
             self.toggle_favorite()
-        elif action == refresh_action:
+        elif action is self._act_refresh:
             self.refresh_game_metadata()
-        elif action == delete_action:
+        elif action is self._act_delete:
             self.delete_game()
     
     # === Game Actions ===
@@ -671,64 +908,71 @@ class MainWindow(QMainWindow):
         """Handle game card click"""
         QMessageBox.information(self, "Game Details", f"Game ID: {game_id}\n\nDetails view coming soon!")
     
+    def _get_game(self, game_id: int):
+        """Look up a displayed game by id, falling back to the DB"""
+        game = self._games_by_id.get(game_id)
+        if game is None:
+            game = self.db.get_game(game_id)
+        return game
+
     def on_play_game(self, game_id: int):
         """Handle play button click"""
-        game = self.db.get_game(game_id)
+        game = self._get_game(game_id)
         if game:
             QMessageBox.information(self, "Play Game", f"Launching: {game.title}\n\nGame launch feature coming soon!")
     
-    def on_table_double_clicked(self, row: int, column: int):
+    def on_table_double_clicked(self, index):
         """Handle double-click on table row"""
-        game_id = self.game_table.item(row, 0).data(Qt.ItemDataRole.UserRole)
+        game_id = self._list_model.game_id_at(index.row())
         self.on_game_clicked(game_id)
     
     def play_selected_game(self):
         """Play selected game"""
-        current_row = self.game_table.currentRow()
+        current_row = self.game_table.currentIndex().row()
         if current_row >= 0:
-            game_id = self.game_table.item(current_row, 0).data(Qt.ItemDataRole.UserRole)
+            game_id = self._list_model.game_id_at(current_row)
             self.on_play_game(game_id)
     
     def open_game_in_browser(self):
         """Open selected game in browser"""
-        current_row = self.game_table.currentRow()
+        current_row = self.game_table.currentIndex().row()
         if current_row >= 0:
-            game_id = self.game_table.item(current_row, 0).data(Qt.ItemDataRole.UserRole)
-            game = self.db.get_game(game_id)
+            game_id = self._list_model.game_id_at(current_row)
+            game = self._get_game(game_id)
             if game and game.url:
                 import webbrowser
                 webbrowser.open(game.url)
     
     def toggle_favorite(self):
         """Toggle favorite status"""
-        current_row = self.game_table.currentRow()
+        current_row = self.game_table.currentIndex().row()
         if current_row >= 0:
-            game_id = self.game_table.item(current_row, 0).data(Qt.ItemDataRole.UserRole)
-            game = self.db.get_game(game_id)
+            game_id = self._list_model.game_id_at(current_row)
+            game = self._get_game(game_id)
             if game:
                 game.is_favorite = not game.is_favorite
                 self.db.update_game(game)
-                self.refresh_library()
+                self._patch_game(current_row, game)
     
     def refresh_game_metadata(self):
         """Refresh metadata for selected game"""
-        current_row = self.game_table.currentRow()
+        current_row = self.game_table.currentIndex().row()
         if current_row >= 0:
-            game_id = self.game_table.item(current_row, 0).data(Qt.ItemDataRole.UserRole)
-            game = self.db.get_game(game_id)
+            game_id = self._list_model.game_id_at(current_row)
+            game = self._get_game(game_id)
             if game and game.url:
                 self.scraper_worker = ScraperWorker(self.auth_service, self.db)
                 self.scraper_worker.set_scan_type('details', game_urls=[game.url])
-                self.scraper_worker.finished_signal.connect(lambda: self.refresh_library())
+                self.scraper_worker.finished_signal.connect(self.refresh_library)
                 self.scraper_worker.start()
                 self.status_bar.showMessage("Refreshing game metadata...")
     
     def delete_game(self):
         """Delete selected game"""
-        current_row = self.game_table.currentRow()
+        current_row = self.game_table.currentIndex().row()
         if current_row >= 0:
-            game_id = self.game_table.item(current_row, 0).data(Qt.ItemDataRole.UserRole)
-            game = self.db.get_game(game_id)
+            game_id = self._list_model.game_id_at(current_row)
+            game = self._get_game(game_id)
             if game:
                 reply = QMessageBox.question(
                     self,
@@ -738,16 +982,24 @@ class MainWindow(QMainWindow):
                 )
                 if reply == QMessageBox.StandardButton.Yes:
                     self.db.delete_game(game_id)
-                    self.refresh_library()
+                    # Drop the one row/card instead of refetching everything
+                    # The model shares current_games; removing the
+                    # row also drops the entry from the list
+                    self._list_model.remove_row(current_row)
+                    self.grid_view.remove_game(game_id)
+                    self._games_by_id.pop(game_id, None)
     
     # === Settings ===
     
     def show_settings(self):
         """Show settings dialog"""
-        dialog = SettingsDialog(self.settings, self)
-        dialog.theme_changed.connect(self._on_theme_changed)
-        dialog.settings_changed.connect(self._on_settings_changed)
-        dialog.exec()
+        if self._settings_dialog is None:
+            self._settings_dialog = SettingsDialog(self.settings, self)
+            self._settings_dialog.theme_changed.connect(self._on_theme_changed)
+            self._settings_dialog.settings_changed.connect(self._on_settings_changed)
+        if self._settings_dialog.exec() == self._settings_dialog.DialogCode.Accepted:
+            # The dialog closes on save, so the confirmation lives here
+            self.status_bar.showMessage("Settings saved", 3000)
     
     def _on_theme_changed(self, theme: str):
         """Handle theme change"""
@@ -1,30 +1,36 @@
 """
 QSS Theme management
 """
-from pathlib import Path
-
-THEMES_DIR = Path(__file__).parent
+import functools
+from importlib import resources
 
 
+@functools.lru_cache(maxsize=8)
 def load_theme(theme_name: str = "dark") -> str:
     """
     Load QSS theme by name
-    
+
+    Themes are read through importlib.resources, so they resolve from
+    the installed package (including zipped or frozen builds) rather
+    than a bare filesystem path, and the lru_cache makes each theme a
+    one-time read per process.
+
     Args:
         theme_name: "dark" or "light"
-        
+
     Returns:
         QSS stylesheet string
     """
-    theme_file = THEMES_DIR / f"{theme_name}_theme.qss"
-    
-    if not theme_file.exists():
+    package = resources.files(__package__)
+
+    theme_file = package / f"{theme_name}_theme.qss"
+
+    if not theme_file.is_file():
         # Fallback to dark theme
-        theme_file = THEMES_DIR / "dark_theme.qss"
-    
+        theme_file = package / "dark_theme.qss"
+
     try:
-        with open(theme_file, 'r', encoding='utf-8') as f:
-            return f.read()
+        return theme_file.read_text(encoding='utf-8')
     except Exception as e:
         print(f"Failed to load theme {theme_name}: {e}")
         return ""
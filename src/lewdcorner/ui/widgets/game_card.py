@@ -5,9 +5,127 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QFrame
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QSize
-from PyQt6.QtGui import QPixmap, QPainter, QBrush, QColor
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot, QObject, QRunnable, QThreadPool
+from PyQt6.QtGui import QPixmap, QImage, QPixmapCache
+from PyQt6 import sip
+import functools
+import hashlib
 from pathlib import Path
+from typing import Optional
+
+from lewdcorner.config import CACHE_DIR
+
+# Cover images are always shown at this size inside the card
+COVER_WIDTH = 280
+COVER_HEIGHT = 200
+
+# On-disk cache of scaled covers; decoding a 20 KB webp on later starts
+# is far cheaper than re-decoding a multi-megapixel source image
+_SCALED_THUMBS_DIR = CACHE_DIR / "thumbs"
+
+# Placeholder icon per engine for cards without a cover
+_ENGINE_ICONS = {
+    "Ren'Py": "🐍",
+    "Unity": "🔷",
+    "RPGM": "⚔️",
+    "HTML": "🌐",
+}
+
+@functools.lru_cache(maxsize=4096)
+def _truncate_title(title: str) -> str:
+    """Ellipsize overlong titles; cached since cards are rebuilt often"""
+    return title if len(title) <= 60 else title[:57] + "..."
+
+
+class _CoverCache:
+    """Scaled cover pixmaps, backed by Qt's global QPixmapCache.
+
+    Grid refreshes rebuild every card, so without this each refresh
+    re-reads and re-decodes every cover from disk. QPixmapCache is an
+    LRU with a byte budget (set at app start), so cover memory stays
+    bounded however large the library gets. Keying on mtime means a
+    re-downloaded cover invalidates its stale entry automatically.
+    """
+
+    @staticmethod
+    def _key(path: str) -> Optional[str]:
+        try:
+            mtime = Path(path).stat().st_mtime
+        except OSError:
+            return None
+        return f"cover:{path}:{mtime}:{COVER_WIDTH}x{COVER_HEIGHT}"
+
+    @classmethod
+    def get(cls, path: str) -> Optional[QPixmap]:
+        key = cls._key(path)
+        if key is None:
+            return None
+        pixmap = QPixmap()
+        if QPixmapCache.find(key, pixmap):
+            return pixmap
+        return None
+
+    @classmethod
+    def put(cls, path: str, pixmap: QPixmap):
+        key = cls._key(path)
+        if key is not None:
+            QPixmapCache.insert(key, pixmap)
+
+
+class _CoverLoaderSignals(QObject):
+    """Signal holder for _CoverLoader (QRunnable is not a QObject)"""
+
+    done = pyqtSignal(str, QImage)
+
+
+class _CoverLoader(QRunnable):
+    """Decodes and scales a cover image off the GUI thread.
+
+    QImage is safe to use from worker threads; the receiving slot does
+    the QPixmap conversion back on the GUI thread.
+    """
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+        self.signals = _CoverLoaderSignals()
+
+    def run(self):
+        self.signals.done.emit(self.path, self._load_scaled())
+
+    def _thumb_file(self) -> Path:
+        digest = hashlib.sha1(self.path.encode()).hexdigest()
+        return _SCALED_THUMBS_DIR / f"{digest}.webp"
+
+    def _load_scaled(self) -> QImage:
+        """Load the persisted thumbnail, or decode, scale and persist"""
+        thumb_file = self._thumb_file()
+        try:
+            if thumb_file.stat().st_mtime >= Path(self.path).stat().st_mtime:
+                image = QImage(str(thumb_file))
+                if not image.isNull():
+                    return image
+        except OSError:
+            pass
+
+        image = QImage(self.path)
+        if image.isNull():
+            return image
+
+        image = image.scaled(
+            COVER_WIDTH, COVER_HEIGHT,
+            Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+            Qt.TransformationMode.SmoothTransformation
+        )
+
+        # Best effort; a failed save just means a cache miss next start
+        try:
+            _SCALED_THUMBS_DIR.mkdir(parents=True, exist_ok=True)
+            image.save(str(thumb_file), "WEBP", 80)
+        except OSError:
+            pass
+
+        return image
 
 
 class GameCard(QFrame):
@@ -46,59 +164,43 @@ class GameCard(QFrame):
         self.image_label = QLabel()
         self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.image_label.setScaledContents(False)
-        
-        # Load image
-        self._load_image()
-        
+
         image_layout.addWidget(self.image_label)
         layout.addWidget(image_container)
-        
+
         # Content area
         content = QWidget()
         content_layout = QVBoxLayout(content)
         content_layout.setContentsMargins(12, 12, 12, 12)
         content_layout.setSpacing(8)
-        
+
         # Title
-        title = self.game_data.get('title', 'Unknown Game')
-        if len(title) > 60:
-            title = title[:57] + "..."
-        
-        title_label = QLabel(title)
-        title_label.setObjectName("gameCardTitle")
-        title_label.setWordWrap(True)
-        title_label.setMaximumHeight(50)
-        content_layout.addWidget(title_label)
-        
+        self.title_label = QLabel()
+        self.title_label.setObjectName("gameCardTitle")
+        self.title_label.setWordWrap(True)
+        self.title_label.setMaximumHeight(50)
+        content_layout.addWidget(self.title_label)
+
         # Developer
-        developer = self.game_data.get('developer') or 'Unknown'
-        if developer and developer != "Unknown" and developer.strip():
-            developer_label = QLabel(f"👤 {developer}")
-            developer_label.setObjectName("gameCardMeta")
-            developer_label.setStyleSheet("font-weight: 600; color: #6A9FB5;")
-            content_layout.addWidget(developer_label)
-        
+        self.developer_label = QLabel()
+        self.developer_label.setObjectName("gameCardDeveloper")
+        content_layout.addWidget(self.developer_label)
+
         # Version
-        version = self.game_data.get('version') or 'Unknown'
-        if version and version.strip():
-            version_label = QLabel(f"Version: {version}")
-            version_label.setObjectName("gameCardMeta")
-            content_layout.addWidget(version_label)
-        
+        self.version_label = QLabel()
+        self.version_label.setObjectName("gameCardMeta")
+        content_layout.addWidget(self.version_label)
+
         # Engine
-        engine = self.game_data.get('engine') or 'Unknown'
-        if engine and engine.strip():
-            engine_label = QLabel(f"Engine: {engine}")
-            engine_label.setObjectName("gameCardMeta")
-            content_layout.addWidget(engine_label)
-        
+        self.engine_label = QLabel()
+        self.engine_label.setObjectName("gameCardMeta")
+        content_layout.addWidget(self.engine_label)
+
         # Status
-        status = self.game_data.get('status') or 'Unknown'
-        if status and status.strip():
-            status_label = QLabel(f"Status: {status}")
-            status_label.setObjectName("gameCardMeta")
-            content_layout.addWidget(status_label)
-        
+        self.status_label = QLabel()
+        self.status_label.setObjectName("gameCardMeta")
+        content_layout.addWidget(self.status_label)
+
         content_layout.addStretch()
         
         # Action buttons
@@ -107,61 +209,134 @@ class GameCard(QFrame):
         
         play_btn = QPushButton("▶ Play")
         play_btn.setFixedHeight(32)
-        play_btn.clicked.connect(lambda: self.play_clicked.emit(self.game_id))
-        
+        play_btn.clicked.connect(self._on_play)
+
         info_btn = QPushButton("ℹ Info")
         info_btn.setObjectName("secondaryButton")
         info_btn.setFixedHeight(32)
-        info_btn.clicked.connect(lambda: self.clicked.emit(self.game_id))
+        info_btn.clicked.connect(self._on_info)
         
         button_layout.addWidget(play_btn)
         button_layout.addWidget(info_btn)
         
         content_layout.addLayout(button_layout)
-        
+
         layout.addWidget(content)
-    
+
+        self._apply_data()
+
+    @pyqtSlot()
+    def _on_play(self):
+        self.play_clicked.emit(self.game_id)
+
+    @pyqtSlot()
+    def _on_info(self):
+        self.clicked.emit(self.game_id)
+
+    def update_data(self, game_data: dict):
+        """Re-bind this card to another game
+
+        The grid pools cards, so rebinding an existing card must be much
+        cheaper than constructing one: only label texts and the cover
+        change, the widget tree stays as is.
+        """
+        self.game_id = game_data.get('id')
+        self.game_data = game_data
+        self._apply_data()
+
+    def _apply_data(self):
+        """Push the bound game's fields into the card's widgets"""
+        self.title_label.setText(
+            _truncate_title(self.game_data.get('title', 'Unknown Game'))
+        )
+
+        developer = self.game_data.get('developer') or 'Unknown'
+        show_developer = bool(developer != "Unknown" and developer.strip())
+        if show_developer:
+            self.developer_label.setText(f"👤 {developer}")
+        self.developer_label.setVisible(show_developer)
+
+        version = self.game_data.get('version') or 'Unknown'
+        if version.strip():
+            self.version_label.setText(f"Version: {version}")
+        self.version_label.setVisible(bool(version.strip()))
+
+        engine = self.game_data.get('engine') or 'Unknown'
+        if engine.strip():
+            self.engine_label.setText(f"Engine: {engine}")
+        self.engine_label.setVisible(bool(engine.strip()))
+
+        status = self.game_data.get('status') or 'Unknown'
+        if status.strip():
+            self.status_label.setText(f"Status: {status}")
+        self.status_label.setVisible(bool(status.strip()))
+
+        self._load_image()
+
     def _load_image(self):
-        """Load thumbnail image with fallback"""
+        """Show the cached cover, or a placeholder while it decodes"""
         cover_image = self.game_data.get('cover_image', '')
-        
-        # Try to load the image
-        if cover_image and Path(cover_image).exists():
-            pixmap = QPixmap(cover_image)
-            if not pixmap.isNull():
-                # Scale maintaining aspect ratio
-                scaled = pixmap.scaled(
-                    280, 200,
-                    Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                self.image_label.setPixmap(scaled)
+
+        if cover_image:
+            pixmap = _CoverCache.get(cover_image)
+            if pixmap is not None:
+                self._clear_fallback_style()
+                self.image_label.setPixmap(pixmap)
                 return
-        
-        # Fallback: Show game title with icon
+
+        # Paint the placeholder immediately so the grid never waits on
+        # image decode, then hand the file to the thread pool
+        self._show_fallback()
+
+        if cover_image and Path(cover_image).exists():
+            loader = _CoverLoader(cover_image)
+            loader.signals.done.connect(self._on_cover_loaded)
+            QThreadPool.globalInstance().start(loader)
+
+    def _on_cover_loaded(self, path: str, image: QImage):
+        """Receive the decoded cover back on the GUI thread"""
+        if sip.isdeleted(self) or image.isNull():
+            return
+
+        pixmap = QPixmap.fromImage(image)
+        _CoverCache.put(path, pixmap)
+        if path == self.game_data.get('cover_image', ''):
+            self._clear_fallback_style()
+            self.image_label.setPixmap(pixmap)
+
+    def _clear_fallback_style(self):
+        """Drop the fallback QSS rule once a real cover arrives"""
+        if self.image_label.objectName():
+            self.image_label.setObjectName("")
+            self._repolish_image_label()
+
+    def _repolish_image_label(self):
+        """Re-resolve the cover label's style after an object name change
+
+        Skipped while the card is still being constructed - the first
+        polish on show picks the right rule up for free.
+        """
+        if self.isVisible():
+            style = self.image_label.style()
+            style.unpolish(self.image_label)
+            style.polish(self.image_label)
+
+    def _show_fallback(self):
+        """Fallback: Show game title with icon"""
         title = self.game_data.get('title', 'Unknown Game')
         engine = self.game_data.get('engine', '')
         
         # Choose icon based on engine
-        icon = "🎮"
-        if engine == "Ren'Py":
-            icon = "🐍"
-        elif engine == "Unity":
-            icon = "🔷"
-        elif engine == "RPGM" or "RPG Maker" in engine:
-            icon = "⚔️"
-        elif engine == "HTML":
-            icon = "🌐"
-        
+        icon = _ENGINE_ICONS.get(engine, "⚔️" if "RPG Maker" in engine else "🎮")
+
         fallback_text = f"{icon}\n\n{title[:30]}..."
         self.image_label.setText(fallback_text)
         self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.image_label.setWordWrap(True)
-        self.image_label.setStyleSheet(
-            "color: #909090; font-size: 12px; padding: 20px; "
-            "background: qlineargradient(x1:0, y1:0, x2:0, y2:1, "
-            "stop:0 #2a2a2a, stop:1 #1a1a1a);"
-        )
+        # Styled by the #gameCardFallback rule in the theme QSS
+        if self.image_label.objectName() != "gameCardFallback":
+            self.image_label.setObjectName("gameCardFallback")
+            self._repolish_image_label()
     
     def mousePressEvent(self, event):
         """Handle mouse press"""
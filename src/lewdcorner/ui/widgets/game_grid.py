@@ -1,113 +1,232 @@
 """
 Grid view for game cards
 """
-from PyQt6.QtWidgets import QWidget, QScrollArea, QVBoxLayout, QHBoxLayout, QLabel, QGridLayout
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtWidgets import QWidget, QScrollArea, QVBoxLayout, QLabel, QGridLayout
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
 from lewdcorner.ui.widgets.game_card import GameCard
 
+# Grid footprint of one card: fixed card size plus layout spacing
+CARD_CELL_WIDTH = 280 + 20
+CARD_CELL_HEIGHT = 380 + 20
+
+# Rows built beyond the bottom of the viewport so scrolling never
+# reveals an empty cell before its card exists
+BUFFER_ROWS = 2
+
 
 class GameGrid(QScrollArea):
-    """Grid view displaying game cards"""
-    
+    """Grid view displaying game cards
+
+    Cards are built lazily: only the rows intersecting the viewport
+    (plus a small buffer) get widgets, and more are created as the user
+    scrolls. The container is given the full grid height up front so the
+    scrollbar still reflects the whole library.
+    """
+
     game_clicked = pyqtSignal(int)  # game_id
     play_clicked = pyqtSignal(int)  # game_id
-    
+
     def __init__(self, parent=None):
         super().__init__(parent)
-        
+
         self.games = []
         self.cards = []
         self.columns = 4  # Number of columns
-        
+
         self.setWidgetResizable(True)
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        
+
         # Container widget
         self.container = QWidget()
         self.setWidget(self.container)
-        
+
         # Main layout
         self.main_layout = QVBoxLayout(self.container)
         self.main_layout.setContentsMargins(20, 20, 20, 20)
         self.main_layout.setSpacing(20)
-        
+
         # Grid layout for cards
         self.grid_layout = QGridLayout()
         self.grid_layout.setSpacing(20)
         self.main_layout.addLayout(self.grid_layout)
-        
+
         # Spacer
         self.main_layout.addStretch()
-        
+
         # Empty state
         self.empty_label = QLabel("No games found")
         self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.empty_label.setStyleSheet("color: #707070; font-size: 16px; padding: 40px;")
         self.main_layout.addWidget(self.empty_label)
         self.empty_label.hide()
-    
+
+        self.verticalScrollBar().valueChanged.connect(self._on_scroll)
+
+        # Coalesce the resize storm of a window drag into one relayout
+        self._pending_columns = self.columns
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self._apply_columns)
+
     def set_games(self, games: list):
         """Set games to display"""
         self.games = games
         self._refresh_view()
-    
+
     def clear(self):
         """Clear all cards"""
         self.games = []
         self._clear_grid()
+        self._update_container_height()
         self.empty_label.show()
-    
+
     def _clear_grid(self):
         """Clear grid layout"""
         for card in self.cards:
             card.deleteLater()
         self.cards.clear()
-        
+
         # Clear grid layout
         while self.grid_layout.count():
             item = self.grid_layout.takeAt(0)
             if item.widget():
                 item.widget().deleteLater()
-    
+
     def _refresh_view(self):
-        """Refresh the grid view"""
-        self._clear_grid()
-        
+        """Refresh the grid view, recycling pooled cards
+
+        Existing cards are re-bound to the new game list in place; only
+        the difference between the old and new visible count is actually
+        created or destroyed.
+        """
         if not self.games:
+            self._clear_grid()
+            self._update_container_height()
             self.empty_label.show()
             return
-        
+
         self.empty_label.hide()
-        
-        # Create cards
-        for index, game in enumerate(self.games):
-            card = GameCard(game)
+
+        needed = min(self._needed_card_count(), len(self.games))
+
+        # Re-bind the cards both lists have
+        for index in range(min(len(self.cards), needed)):
+            self.cards[index].update_data(self.games[index])
+
+        # Drop the surplus from a shrinking list
+        while len(self.cards) > needed:
+            card = self.cards.pop()
+            self.grid_layout.removeWidget(card)
+            card.deleteLater()
+
+        self._update_container_height()
+        self._ensure_cards(needed)
+
+    def _needed_card_count(self) -> int:
+        """Number of cards required to cover the scrolled-to viewport"""
+        bottom = self.verticalScrollBar().value() + self.viewport().height()
+        rows = bottom // CARD_CELL_HEIGHT + 1 + BUFFER_ROWS
+        return rows * self.columns
+
+    def _ensure_cards(self, count: int):
+        """Build cards up to index count (capped at the game list)"""
+        for index in range(len(self.cards), min(count, len(self.games))):
+            card = GameCard(self.games[index])
             card.clicked.connect(self.game_clicked.emit)
             card.play_clicked.connect(self.play_clicked.emit)
-            
-            # Calculate row and column
-            row = index // self.columns
-            col = index % self.columns
-            
-            self.grid_layout.addWidget(card, row, col)
+
+            self.grid_layout.addWidget(card, index // self.columns, index % self.columns)
             self.cards.append(card)
-    
+
+    def _update_container_height(self):
+        """Reserve vertical space for every row, built or not"""
+        rows = (len(self.games) + self.columns - 1) // self.columns
+        margins = self.main_layout.contentsMargins()
+        self.container.setMinimumHeight(
+            rows * CARD_CELL_HEIGHT + margins.top() + margins.bottom()
+        )
+
+    def _on_scroll(self, value):
+        """Build the cards for rows scrolled into view"""
+        if self.games and len(self.cards) < len(self.games):
+            self._ensure_cards(self._needed_card_count())
+
+    def update_game(self, game_data: dict):
+        """Replace a single game's card without rebuilding the grid"""
+        game_id = game_data.get('id')
+        for index, game in enumerate(self.games):
+            if game.get('id') == game_id:
+                break
+        else:
+            return
+
+        self.games[index] = game_data
+        if index < len(self.cards):
+            self.cards[index].update_data(game_data)
+        # Otherwise the card isn't built yet; the updated data is picked
+        # up when its row scrolls into view
+
+    def remove_game(self, game_id: int):
+        """Remove a single game's card and reflow the ones after it"""
+        for index, game in enumerate(self.games):
+            if game.get('id') == game_id:
+                break
+        else:
+            return
+
+        self.games.pop(index)
+        if index < len(self.cards):
+            card = self.cards.pop(index)
+            self.grid_layout.removeWidget(card)
+            card.deleteLater()
+
+            # Shift the remaining cards back one slot
+            for i in range(index, len(self.cards)):
+                self.grid_layout.addWidget(self.cards[i], i // self.columns, i % self.columns)
+
+        self._update_container_height()
+        if not self.games:
+            self.empty_label.show()
+
     def set_columns(self, columns: int):
         """Set number of columns"""
         if columns != self.columns:
             self.columns = max(1, columns)
-            self._refresh_view()
-    
+            self._reflow()
+
+    def _reflow(self):
+        """Re-position existing cards for the current column count
+
+        The cards already hold their decoded covers and laid-out labels;
+        addWidget on an already-parented widget just moves it, so a
+        column change is O(N) slot moves instead of a full teardown and
+        rebuild.
+        """
+        for index, card in enumerate(self.cards):
+            self.grid_layout.addWidget(card, index // self.columns, index % self.columns)
+
+        self._update_container_height()
+        if self.games:
+            # More columns per row can pull unbuilt rows into view
+            self._ensure_cards(self._needed_card_count())
+
     def resizeEvent(self, event):
-        """Handle resize - adjust columns"""
+        """Handle resize - adjust columns, debounced"""
         super().resizeEvent(event)
-        
-        # Auto-adjust columns based on width
+
+        # Auto-adjust columns based on width; only the final geometry of
+        # a drag triggers the relayout
         width = self.viewport().width()
-        card_width = 300  # Card width + spacing
-        
-        new_columns = max(1, width // card_width)
-        if new_columns != self.columns:
-            self.columns = new_columns
-            self._refresh_view()
+        self._pending_columns = max(1, width // CARD_CELL_WIDTH)
+        self._resize_timer.start()
+
+    def _apply_columns(self):
+        """Apply the column count from the last resize event"""
+        if self._pending_columns != self.columns:
+            self.columns = self._pending_columns
+            self._reflow()
+        elif self.games:
+            # A taller viewport may expose rows that have no cards yet
+            self._ensure_cards(self._needed_card_count())
@@ -2,25 +2,34 @@
 Background worker for scraping operations
 """
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any
 from PyQt6.QtCore import QThread, pyqtSignal
 
 from lewdcorner.core.auth.auth_service import AuthService
 from lewdcorner.core.scraper_engine.game_scraper import GameScraper
 from lewdcorner.core.db.database import DatabaseManager
-from lewdcorner.config import ALLOWED_FORUMS
+from lewdcorner.config import ALLOWED_FORUMS, ALLOWED_FORUM_NAMES
 
 logger = logging.getLogger(__name__)
 
+_TOTAL_FORUMS = len(ALLOWED_FORUMS)
+
 
 class ScraperWorker(QThread):
     """Worker thread for scraping games"""
     
     # Signals
     progress = pyqtSignal(str, int)  # message, percentage
-    game_found = pyqtSignal(dict)  # game data
+    games_batch = pyqtSignal(list)  # batch of game data dicts
     error_occurred = pyqtSignal(str)  # error message
     finished_signal = pyqtSignal(int)  # total games found
+
+    # Flush thresholds for batched emissions; every cross-thread
+    # signal is a queued meta-call that wakes the UI thread
+    BATCH_SIZE = 50
+    BATCH_INTERVAL = 0.25  # seconds
     
     def __init__(self, auth_service: AuthService, db_manager: DatabaseManager):
         super().__init__()
@@ -31,6 +40,9 @@ class ScraperWorker(QThread):
         self.scan_type = 'forums'  # 'forums', 'bookmarks', 'details'
         self.max_pages = 5
         self.game_urls = []  # For detail scraping
+        self._batch = []
+        self._batch_started = time.monotonic()
+        self._last_progress = (None, -1)  # (message, percent)
     
     def stop(self):
         """Stop the worker"""
@@ -42,10 +54,37 @@ class ScraperWorker(QThread):
         self.max_pages = max_pages
         self.game_urls = game_urls or []
     
+    def _emit_game(self, game: Dict):
+        """Buffer a found game; emitted in batches to limit UI wakeups"""
+        self._batch.append(game)
+        if (len(self._batch) >= self.BATCH_SIZE
+                or time.monotonic() - self._batch_started >= self.BATCH_INTERVAL):
+            self._flush_games()
+
+    def _flush_games(self):
+        """Emit any buffered games as one batch"""
+        if self._batch:
+            self.games_batch.emit(self._batch)
+            self._batch = []
+        self._batch_started = time.monotonic()
+
+    def _emit_progress(self, message: str, percent: int):
+        """Emit progress, skipping exact repeats
+
+        Every emit is a queued cross-thread signal plus a status repaint,
+        so an update where neither the message nor the percentage changed
+        is not worth delivering. A new message at the same percentage
+        still goes through - phase changes often land on the same value.
+        """
+        if (message, percent) != self._last_progress:
+            self.progress.emit(message, percent)
+            self._last_progress = (message, percent)
+
     def run(self):
         """Execute scraping task"""
         try:
-            self.progress.emit("Initializing scraper...", 0)
+            self._last_progress = (None, -1)
+            self._emit_progress("Initializing scraper...", 0)
             
             self.scraper = GameScraper(self.auth_service)
             self.scraper.initialize()
@@ -60,97 +99,136 @@ class ScraperWorker(QThread):
         except Exception as e:
             logger.error(f"Scraper worker error: {e}")
             self.error_occurred.emit(f"Scraping error: {str(e)}")
+        finally:
+            # Don't strand buffered games if a scan aborts mid-batch
+            self._flush_games()
     
     def _scan_forums(self):
         """Scan all allowed forums"""
         all_games = []
-        
-        total_forums = len(ALLOWED_FORUMS)
-        
-        for idx, forum_url in enumerate(ALLOWED_FORUMS):
+
+        for idx, (forum_url, forum_name) in enumerate(zip(ALLOWED_FORUMS, ALLOWED_FORUM_NAMES)):
             if self._should_stop:
                 break
-            
-            forum_name = forum_url.split('/')[-2] if '/' in forum_url else 'Unknown'
-            self.progress.emit(f"Scanning forum {idx + 1}/{total_forums}: {forum_name}", 
-                             int((idx / total_forums) * 90))
+
+            self._emit_progress(f"Scanning forum {idx + 1}/{_TOTAL_FORUMS}: {forum_name}",
+                                int((idx / _TOTAL_FORUMS) * 90))
             
             try:
                 games = self.scraper.scan_forum(forum_url, self.max_pages)
-                
-                # Save to database
-                for game in games:
-                    if self._should_stop:
-                        break
-                    
-                    try:
-                        game_id = self.db.upsert_game(game)
-                        game['id'] = game_id
-                        self.game_found.emit(game)
-                        all_games.append(game)
-                    except Exception as e:
-                        logger.error(f"Failed to save game: {e}")
+
+                # Save to database, one commit per forum
+                with self.db.transaction():
+                    for game in games:
+                        if self._should_stop:
+                            break
+
+                        try:
+                            game_id = self.db.upsert_game(game)
+                            game['id'] = game_id
+                            self._emit_game(game)
+                            all_games.append(game)
+                        except Exception as e:
+                            logger.error(f"Failed to save game: {e}")
                 
             except Exception as e:
                 logger.error(f"Failed to scan forum {forum_url}: {e}")
                 self.error_occurred.emit(f"Error scanning forum: {str(e)}")
         
-        self.progress.emit("Scan complete!", 100)
+        self._flush_games()
+        self._emit_progress("Scan complete!", 100)
         self.finished_signal.emit(len(all_games))
     
     def _scan_bookmarks(self):
         """Scan user bookmarks"""
-        self.progress.emit("Scanning bookmarks...", 10)
+        self._emit_progress("Scanning bookmarks...", 10)
         
         try:
             games = self.scraper.scrape_bookmarks(self.max_pages)
             
-            self.progress.emit(f"Found {len(games)} bookmarked games", 50)
+            self._emit_progress(f"Found {len(games)} bookmarked games", 50)
             
-            # Save to database
+            # Save to database in one transaction
             saved_count = 0
-            for idx, game in enumerate(games):
-                if self._should_stop:
-                    break
-                
-                try:
-                    game['is_bookmarked'] = True
-                    game_id = self.db.upsert_game(game)
-                    game['id'] = game_id
-                    self.game_found.emit(game)
-                    saved_count += 1
-                    
-                    progress = 50 + int((idx / len(games)) * 50)
-                    self.progress.emit(f"Saved {saved_count}/{len(games)} games", progress)
-                    
-                except Exception as e:
-                    logger.error(f"Failed to save bookmark: {e}")
+            total = len(games)
+
+            # Integer percent per index, computed once. The message
+            # embeds the running count, so the loop gates on the percent
+            # step itself - otherwise every iteration would emit - which
+            # caps signals at ~50 per scan
+            progress_steps = [50 + int((i / total) * 50) for i in range(total)]
+            last_pct = None
+
+            with self.db.transaction():
+                for idx, game in enumerate(games):
+                    if self._should_stop:
+                        break
+
+                    try:
+                        game['is_bookmarked'] = True
+                        game_id = self.db.upsert_game(game)
+                        game['id'] = game_id
+                        self._emit_game(game)
+                        saved_count += 1
+
+                        pct = progress_steps[idx]
+                        if pct != last_pct:
+                            self._emit_progress(f"Saved {saved_count}/{total} games", pct)
+                            last_pct = pct
+
+                    except Exception as e:
+                        logger.error(f"Failed to save bookmark: {e}")
             
-            self.progress.emit("Bookmark scan complete!", 100)
+            self._flush_games()
+            self._emit_progress("Bookmark scan complete!", 100)
             self.finished_signal.emit(saved_count)
             
         except Exception as e:
             logger.error(f"Failed to scan bookmarks: {e}")
             self.error_occurred.emit(f"Bookmark scan error: {str(e)}")
     
+    # Concurrent detail fetches kept in flight per scrape
+    DETAIL_CONCURRENCY = 8
+
     def _scrape_details(self):
         """Scrape detailed info for specific games"""
         total = len(self.game_urls)
+        if not total:
+            self.finished_signal.emit(0)
+            return
+
+        # Fetch several pages at once over the requests session;
+        # executor.map streams results in submission order, so progress
+        # reporting stays monotonic
+        progress_steps = [int((i / total) * 100) for i in range(total)]
+        last_pct = None
+
+        with ThreadPoolExecutor(max_workers=min(self.DETAIL_CONCURRENCY, total)) as executor:
+            results = executor.map(self.scraper.scrape_game_details_fast, self.game_urls)
+
+            for idx, (url, metadata) in enumerate(zip(self.game_urls, results)):
+                if self._should_stop:
+                    # Cancel the queued fetches; the with-block's implicit
+                    # shutdown(wait=True) would otherwise drain every
+                    # pending future (up to 30s each) before Stop lands
+                    executor.shutdown(cancel_futures=True)
+                    break
+
+                # Count-bearing message: gate on the percent step so the
+                # loop doesn't emit every iteration
+                pct = progress_steps[idx]
+                if pct != last_pct:
+                    self._emit_progress(f"Scraping game {idx + 1}/{total}", pct)
+                    last_pct = pct
+
+                try:
+                    if metadata:
+                        game_id = self.db.upsert_game(metadata)
+                        metadata['id'] = game_id
+                        self._emit_game(metadata)
+                except Exception as e:
+                    logger.error(f"Failed to scrape details for {url}: {e}")
         
-        for idx, url in enumerate(self.game_urls):
-            if self._should_stop:
-                break
-            
-            self.progress.emit(f"Scraping game {idx + 1}/{total}", int((idx / total) * 100))
-            
-            try:
-                metadata = self.scraper.scrape_game_details(url)
-                if metadata:
-                    game_id = self.db.upsert_game(metadata)
-                    metadata['id'] = game_id
-                    self.game_found.emit(metadata)
-            except Exception as e:
-                logger.error(f"Failed to scrape details for {url}: {e}")
-        
-        self.progress.emit("Detail scraping complete!", 100)
+        self._flush_games()
+        self._emit_progress("Detail scraping complete!", 100)
         self.finished_signal.emit(len(self.game_urls))